@@ -0,0 +1,696 @@
+import codecs
+import copy
+import heapq
+import mmap
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from operator import itemgetter
+
+from char_counts import CHAR_CLASSES, CharCounts
+from ngrams import NgramCounter, ngram_size
+from sketch import HeavyHitters
+from stopwords import compile_stopwords, load_stopwords
+from tokenizer import normalize, tokenize
+
+# Dimensiunea unui bloc citit din fișier (în octeți)
+CHUNK_SIZE = 1024 * 1024
+
+# Fișierele .txt mai mari de atât nu mai sunt încărcate în memorie, ci analizate în flux
+STREAMING_THRESHOLD = 32 * 1024 * 1024
+
+# Peste acest prag fișierul este împărțit în fragmente numărate în procese separate
+PARALLEL_THRESHOLD = 128 * 1024 * 1024
+
+ANALYSIS_MODES = ("words", "numbers", "letters", "all")
+
+# Set of common connecting words to exclude (stopwords/en.txt, stopwords/ro.txt)
+CONNECTING_WORDS = load_stopwords()
+
+# Mod special: toate tipurile de analiză dintr-o singură citire a conținutului
+MULTI_MODE = "multi"
+
+NUMBER_PATTERN = re.compile(r'\b\d+(?:\.\d+)?\b')
+
+# Același tipar aplicat direct octeților din fișier (mmap); pe textul ASCII găsește exact aceleași numere
+NUMBER_BYTES = re.compile(NUMBER_PATTERN.pattern.encode("ascii"))
+NON_ASCII_BYTES = re.compile(rb"[\x80-\xff]")
+
+# Zonele cu caractere non-ASCII mai apropiate de atât (în octeți) sunt decodate împreună
+NON_ASCII_GAP = 4096
+NON_ASCII_END = re.compile(rb"[\x80-\xff][\x00-\x7f]{%d}" % NON_ASCII_GAP)
+ASCII_BYTES = bytes(range(0x80))
+
+# Octeții de spațiu alb ASCII; în UTF-8 nu pot apărea în interiorul unui caracter multi-octet
+WHITESPACE_BYTES = re.compile(rb"[ \t\n\r\x0b\x0c]")
+WHITESPACE_CHARS = (b" ", b"\t", b"\n", b"\r", b"\x0b", b"\x0c")
+WHITESPACE_PATTERN = re.compile(r"\s")
+# Toate caracterele pentru care str.isspace() este adevărat (niciunul nu trece de U+3000)
+SPACE_CHARACTERS = "".join(char for char in map(chr, range(0x3001)) if char.isspace())
+
+# Un "cuvânt" mai lung fără spațiu alb (text minificat sau binar) nu mai este păstrat pentru
+# blocul următor, ci numărat în bucăți, ca restul să nu fie recopiat și recăutat la fiecare bloc
+MAX_REMAINDER = CHUNK_SIZE
+
+
+class AnalysisCancelled(Exception):
+    """Analiza a fost oprită de utilizator."""
+
+
+def iter_text_chunks(file_path, chunk_size=CHUNK_SIZE, encoding="utf-8", start=0, end=None, on_read=None):
+    """Citește fișierul pe bucăți care se termină mereu pe un spațiu alb.
+
+    Ultimul cuvânt dintr-un bloc (posibil tăiat) este păstrat și lipit la
+    începutul blocului următor, astfel încât niciun element nu este împărțit.
+    start/end limitează citirea la un interval de octeți din fișier, iar
+    on_read primește numărul de octeți citiți la fiecare pas.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    remainder = ""
+    with open(file_path, "rb") as file:
+        file.seek(start)
+        left = None if end is None else end - start
+        while True:
+            size = chunk_size if left is None else min(chunk_size, left)
+            raw = file.read(size) if size > 0 else b""
+            if left is not None:
+                left -= len(raw)
+            if on_read is not None:
+                on_read(len(raw))
+            if not raw:
+                remainder += decoder.decode(b"", final=True)
+                break
+            complete, remainder = split_at_whitespace(remainder + decoder.decode(raw), len(remainder))
+            if complete:
+                yield complete
+
+    if remainder:
+        yield remainder
+
+
+def split_at_whitespace(block, start=0):
+    """Împarte textul după ultimul spațiu alb: (partea completă, ultimul cuvânt posibil tăiat).
+
+    start: primele caractere (restul blocului anterior) nu conțin spațiu alb,
+    deci se caută doar după ele. Un rest mai lung decât MAX_REMAINDER este
+    întors ca parte completă.
+    """
+    cut = max(block.rfind(char, start) for char in SPACE_CHARACTERS) + 1
+    if len(block) - cut > MAX_REMAINDER:
+        cut = len(block)
+    return block[:cut], block[cut:]
+
+
+def iter_string_chunks(text, chunk_size=CHUNK_SIZE):
+    """Împarte un text din memorie în bucăți care se termină pe un spațiu alb."""
+    position = 0
+    while position < len(text):
+        end = position + chunk_size
+        if end < len(text):
+            match = WHITESPACE_PATTERN.search(text, end)
+            end = match.end() if match else len(text)
+        yield text[position:end]
+        position = end
+
+
+def count_text(text, mode, connecting_words=(), counts=None):
+    """Numără elementele unui text pentru tipul de analiză dat.
+
+    Întoarce (contor, total_elemente, total_jetoane); pentru "words" total_jetoane
+    este numărul tuturor cuvintelor, pentru celelalte moduri este egal cu total_elemente.
+    """
+    if counts is None:
+        counts = Counter()
+
+    if mode == "words":
+        # O singură trecere: normalizare Unicode, casefold și extragerea cuvintelor (tokenizer.py),
+        # apoi eliminarea cuvintelor și expresiilor de legătură (stopwords.py)
+        words = tokenize(text)
+        meaningful, _ = compile_stopwords(frozenset(connecting_words)).filter(words)
+        counts.update(meaningful)
+        return counts, len(meaningful), len(words)
+
+    if mode in CHAR_CLASSES:
+        # Histograma caracterelor este calculată vectorizat, fără un obiect str per caracter
+        chars = CharCounts()
+        chars.update(normalize(text))
+        items, total, _ = chars.select(mode)
+        counts.update(items)
+        return counts, total, total
+
+    if mode != "numbers":
+        raise ValueError(f"Tip de analiză necunoscut: {mode}")
+    items = NUMBER_PATTERN.findall(text)
+    counts.update(items)
+    return counts, len(items), len(items)
+
+
+class ModeCounter:
+    """Acumulează numărătorile pentru un singur tip de analiză.
+
+    approximate = (epsilon, delta) înlocuiește Counter-ul cu o schiță de memorie
+    fixă (sketch.HeavyHitters), care păstrează doar elementele frecvente. Literele
+    și caracterele sunt acumulate într-o histogramă vectorizată (CharCounts).
+    Pentru cuvinte, jetoanele de la sfârșitul unui bloc care pot începe o
+    expresie de legătură sunt păstrate până la blocul următor.
+    """
+
+    def __init__(self, mode, connecting_words=(), approximate=None):
+        self.mode = mode
+        self.connecting_words = connecting_words
+        self.stopwords = compile_stopwords(frozenset(connecting_words))
+        self.pending = []
+        if mode in CHAR_CLASSES:
+            self.counts = CharCounts()
+        else:
+            self.counts = HeavyHitters(*approximate) if approximate else Counter()
+        self.total_items = 0
+        self.total_tokens = 0
+
+    def update(self, text):
+        if isinstance(self.counts, CharCounts):
+            self.counts.update(normalize(text))
+            return
+        if self.mode == "words":
+            words = tokenize(text)
+            meaningful, self.pending = self.stopwords.filter(self.pending + words, final=False)
+            self.counts.update(meaningful)
+            self.total_items += len(meaningful)
+            self.total_tokens += len(words)
+            return
+        _, items, tokens = count_text(text, self.mode, self.connecting_words, self.counts)
+        self.total_items += items
+        self.total_tokens += tokens
+
+    def add_counts(self, counts, total):
+        """Adaugă elemente deja numărate (de exemplu numerele găsite direct în octeții fișierului)"""
+        self.counts.update(counts)
+        self.total_items += total
+        self.total_tokens += total
+
+    def flush(self):
+        """Numără jetoanele păstrate pentru o expresie care nu mai poate continua"""
+        meaningful = self.stopwords.tail(self.pending)
+        self.pending = []
+        return meaningful
+
+    def merge(self, other):
+        if self.mode == "words":
+            # Fragmentele sunt consecutive și împărțite astfel încât nicio expresie să nu treacă dintr-unul în altul
+            meaningful = self.flush()
+            self.counts.update(meaningful)
+            self.total_items += len(meaningful)
+            self.pending = list(other.pending)
+        self.counts.update(other.counts)
+        self.total_items += other.total_items
+        self.total_tokens += other.total_tokens
+
+    def result(self):
+        if isinstance(self.counts, CharCounts):
+            return self.counts.select(self.mode)
+        counts = self.counts.to_counter() if isinstance(self.counts, HeavyHitters) else self.counts
+        tail = self.stopwords.tail(self.pending)
+        if tail:
+            if not isinstance(self.counts, HeavyHitters):
+                counts = counts.copy()
+            counts.update(tail)
+        return counts, self.total_items + len(tail), self.total_tokens
+
+
+class MultiModeCounter:
+    """Acumulează toate tipurile de analiză dintr-o singură citire a conținutului.
+
+    Literele și caracterele alfanumerice se obțin la final din aceeași histogramă
+    de caractere, deci rezultatul conține câte un (contor, total_elemente,
+    total_jetoane) pentru fiecare mod din ANALYSIS_MODES. Numărarea aproximativă
+    se aplică doar cuvintelor și numerelor; alfabetul rămâne numărat exact.
+    """
+
+    def __init__(self, connecting_words=(), approximate=None):
+        self.words = ModeCounter("words", connecting_words, approximate)
+        self.numbers = ModeCounter("numbers", approximate=approximate)
+        self.chars = CharCounts()
+
+    def update(self, text):
+        self.words.update(text)
+        self.numbers.update(text)
+        self.chars.update(normalize(text))
+
+    def merge(self, other):
+        self.words.merge(other.words)
+        self.numbers.merge(other.numbers)
+        self.chars.update(other.chars)
+
+    def result(self):
+        return {
+            "words": self.words.result(),
+            "numbers": self.numbers.result(),
+            **self.chars.split(),
+        }
+
+
+def make_counter(mode, connecting_words=(), approximate=None):
+    if mode == MULTI_MODE:
+        return MultiModeCounter(connecting_words, approximate)
+    if ngram_size(mode):
+        # N-gramele sunt numărate mereu exact, pe identificatori internați (ngrams.py)
+        return NgramCounter(ngram_size(mode), connecting_words)
+    if mode in ("letters", "all"):
+        approximate = None  # Alfabetul este mic, numărarea exactă nu costă memorie
+    return ModeCounter(mode, connecting_words, approximate)
+
+
+def count_chunks(chunks, mode, connecting_words=(), progress=None, cancel=None, approximate=None):
+    """Numără elementele dintr-o succesiune de blocuri de text.
+
+    progress este apelat după fiecare bloc, iar dacă cancel (un threading.Event)
+    este setat, numărarea se oprește cu AnalysisCancelled.
+    """
+    counter = make_counter(mode, connecting_words, approximate)
+
+    for chunk in chunks:
+        if cancel is not None and cancel.is_set():
+            raise AnalysisCancelled()
+        counter.update(chunk)
+        if progress is not None:
+            progress()
+
+    return counter.result()
+
+
+def count_string(text, mode, connecting_words=(), progress=None, cancel=None, chunk_size=CHUNK_SIZE,
+                 approximate=None):
+    """Numără un text din memorie pe bucăți, raportând progresul ca fracție între 0 și 1."""
+    length = len(text) or 1
+    done = [0]
+
+    def chunks():
+        for chunk in iter_string_chunks(text, chunk_size):
+            done[0] += len(chunk)
+            yield chunk
+
+    def report():
+        if progress is not None:
+            progress(done[0] / length)
+
+    return count_chunks(chunks(), mode, connecting_words, report, cancel, approximate)
+
+
+def token_start(buffer, start, position):
+    """Începutul cuvântului (secvență fără spațiu alb ASCII) care conține octetul de la position"""
+    space = max(buffer.rfind(char, start, position) for char in WHITESPACE_CHARS)
+    return start if space < 0 else space + 1
+
+
+def token_end(buffer, position, end):
+    match = WHITESPACE_BYTES.search(buffer, position, end)
+    return match.start() if match else end
+
+
+def scan_numbers(buffer, start, end, counts):
+    """Adaugă la counts numerele din buffer[start:end] (un interval care începe și se termină pe spațiu alb).
+
+    Numerele sunt numărate ca octeți (UTF-8). Porțiunile ASCII sunt căutate cu
+    NUMBER_BYTES direct în buffer, fără decodare. Cuvintele care
+    conțin octeți non-ASCII (unde \\b și \\d depind de Unicode) sunt decodate și
+    căutate cu NUMBER_PATTERN, deci rezultatul este identic cu cel pentru textul
+    decodat. Un interval cu multe caractere non-ASCII (text obișnuit cu
+    diacritice) este decodat întreg. Întoarce numărul de numere găsite.
+    """
+    block = buffer[start:end]
+    non_ascii = len(block.translate(None, ASCII_BYTES))
+    if not non_ascii:
+        found = NUMBER_BYTES.findall(buffer, start, end)
+        counts.update(found)
+        return len(found)
+    if non_ascii * NON_ASCII_GAP > len(block):
+        found = NUMBER_PATTERN.findall(block.decode("utf-8"))
+        counts.update(map(str.encode, found))
+        return len(found)
+
+    total = 0
+    position = start
+    while position < end:
+        run = NON_ASCII_BYTES.search(buffer, position, end)
+        ascii_end = end if run is None else token_start(buffer, position, run.start())
+        found = NUMBER_BYTES.findall(buffer, position, ascii_end)
+        counts.update(found)
+        total += len(found)
+        if run is None:
+            break
+
+        # Zona decodată se termină după ultimul octet non-ASCII urmat de cel puțin NON_ASCII_GAP octeți ASCII,
+        # deci textul obișnuit (cu diacritice) nu este împărțit în bucăți mici
+        last = NON_ASCII_END.search(buffer, run.start(), end)
+        region_end = end if last is None else token_end(buffer, last.start() + 1, end)
+        found = NUMBER_PATTERN.findall(buffer[ascii_end:region_end].decode("utf-8"))
+        counts.update(map(str.encode, found))
+        total += len(found)
+        position = region_end
+    return total
+
+
+def count_mapped_numbers(file_path, start=0, end=None, chunk_size=CHUNK_SIZE, progress=None, cancel=None,
+                         approximate=None):
+    """Numără numerele dintr-un fișier (sau un interval de octeți) mapat în memorie.
+
+    Fișierul nu este citit și decodat ca text: expresia regulată rulează direct
+    pe octeții din mmap, iar citirea este lăsată în seama cache-ului sistemului
+    de operare. Doar numerele distincte sunt decodate, la final (sau după fiecare
+    bloc, pentru numărarea aproximativă). Întoarce un ModeCounter("numbers"),
+    care poate fi combinat cu cele ale altor fragmente; progress primește
+    numărul de octeți parcurși.
+    """
+    counter = make_counter("numbers", approximate=approximate)
+    if end is None:
+        end = os.path.getsize(file_path)
+    if end <= start:
+        return counter
+
+    found = Counter()
+    total = 0
+
+    def flush():
+        nonlocal found, total
+        counter.add_counts({number.decode("utf-8"): count for number, count in found.items()}, total)
+        found = Counter()
+        total = 0
+
+    with open(file_path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        end = min(end, len(buffer))
+        position = start
+        while position < end:
+            if cancel is not None and cancel.is_set():
+                raise AnalysisCancelled()
+            # Blocuri care se termină pe un spațiu alb, pentru progres și anulare
+            block_end = end
+            if position + chunk_size < end:
+                match = WHITESPACE_BYTES.search(buffer, position + chunk_size, end)
+                block_end = match.end() if match else end
+            total += scan_numbers(buffer, position, block_end, found)
+            if approximate:
+                flush()  # Memoria rămâne fixă: schița primește fiecare bloc
+            if progress is not None:
+                progress(block_end - start)
+            position = block_end
+    flush()
+    return counter
+
+
+def count_file_stream(file_path, mode, connecting_words=(), chunk_size=CHUNK_SIZE, progress=None, cancel=None,
+                      approximate=None):
+    """Analizează un fișier text bloc cu bloc, fără a-l încărca întreg în memorie.
+
+    Memoria folosită depinde de numărul de elemente distincte, nu de mărimea fișierului.
+    Numerele sunt căutate direct în octeții fișierului mapat în memorie (count_mapped_numbers).
+    """
+    size = os.path.getsize(file_path) or 1
+    read = [0]
+
+    def on_read(count):
+        read[0] += count
+
+    def report():
+        if progress is not None:
+            progress(min(1.0, read[0] / size))
+
+    if mode == "numbers":
+        def on_scan(done):
+            read[0] = done
+            report()
+
+        return count_mapped_numbers(file_path, chunk_size=chunk_size, progress=on_scan, cancel=cancel,
+                                    approximate=approximate).result()
+
+    chunks = iter_text_chunks(file_path, chunk_size, on_read=on_read)
+    return count_chunks(chunks, mode, connecting_words, report, cancel, approximate)
+
+
+def after_whitespace(file, position, size):
+    """Poziția imediat după primul spațiu alb de la position încolo (sau size)"""
+    file.seek(position)
+    while True:
+        block = file.read(64 * 1024)
+        if not block:
+            return size
+        match = WHITESPACE_BYTES.search(block)
+        if match:
+            return position + match.end()
+        position += len(block)
+
+
+def last_token(file, position, window=4096):
+    """Ultimul cuvânt dinaintea poziției (None dacă în fereastră nu există niciunul)"""
+    start = max(0, position - window)
+    file.seek(start)
+    tokens = tokenize(file.read(position - start).decode("utf-8", errors="ignore"))
+    return tokens[-1] if tokens else None
+
+
+def shard_file(file_path, shards, stopwords=None):
+    """Împarte fișierul în intervale de octeți (start, end) care încep după un spațiu alb.
+
+    Cu un StopwordMatcher, granițele sunt mutate după cuvintele cu care nu poate
+    continua nicio expresie de legătură, deci fiecare fragment poate fi numărat
+    separat cu același rezultat ca fișierul întreg.
+    """
+    size = os.path.getsize(file_path)
+    shards = max(1, min(shards, size // CHUNK_SIZE or 1))
+    bounds = [0]
+
+    with open(file_path, "rb") as file:
+        for i in range(1, shards):
+            position = after_whitespace(file, max(size * i // shards, bounds[-1]), size)
+            if stopwords is not None and stopwords.continuing:
+                while position < size and last_token(file, position) in stopwords.continuing:
+                    position = after_whitespace(file, position, size)
+            if position >= size:
+                break
+            bounds.append(position)
+
+    bounds.append(size)
+    return [(bounds[i], bounds[i + 1]) for i in range(len(bounds) - 1) if bounds[i] < bounds[i + 1]]
+
+
+def _count_shard(file_path, start, end, mode, connecting_words, chunk_size, approximate=None):
+    if mode == "numbers":
+        return count_mapped_numbers(file_path, start, end, chunk_size, approximate=approximate)
+    counter = make_counter(mode, connecting_words, approximate)
+    for chunk in iter_text_chunks(file_path, chunk_size, start=start, end=end):
+        counter.update(chunk)
+    return counter
+
+
+def wait_result(future, cancel=None):
+    """Așteaptă rezultatul unui proces verificând periodic cererea de anulare"""
+    while True:
+        if cancel is not None and cancel.is_set():
+            raise AnalysisCancelled()
+        try:
+            return future.result(timeout=0.1)
+        except FutureTimeoutError:
+            continue
+
+
+def terminate_pool(executor):
+    """Oprește imediat procesele unui ProcessPoolExecutor (la anulare sau eroare).
+
+    shutdown(wait=False) doar anulează lucrările din coadă; cele aflate deja în
+    lucru ar continua în fundal, deci procesele sunt terminate și așteptate.
+    """
+    terminate = getattr(executor, "terminate_workers", None)  # Python 3.14+
+    if terminate is not None:
+        terminate()
+        return
+    processes = list((executor._processes or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        process.join()
+
+
+def count_file_parallel(file_path, mode, connecting_words=(), workers=None, chunk_size=CHUNK_SIZE,
+                        progress=None, cancel=None, approximate=None):
+    """Numără un fișier mare folosind toate nucleele: fiecare fragment într-un proces.
+
+    Contoarele parțiale sunt combinate în ordinea fragmentelor, deci rezultatul
+    (inclusiv ordinea egalităților) este identic cu cel al count_file_stream.
+    """
+    workers = workers or os.cpu_count() or 1
+    shards = shard_file(file_path, workers, compile_stopwords(frozenset(connecting_words)))
+    if len(shards) <= 1:
+        return count_file_stream(file_path, mode, connecting_words, chunk_size, progress, cancel, approximate)
+
+    connecting_words = frozenset(connecting_words)
+    counter = None
+
+    executor = ProcessPoolExecutor(max_workers=min(workers, len(shards)))
+    try:
+        futures = [executor.submit(_count_shard, file_path, start, end, mode, connecting_words, chunk_size,
+                                   approximate)
+                   for start, end in shards]
+        for done, future in enumerate(futures, 1):
+            shard_counter = wait_result(future, cancel)
+            if counter is None:
+                counter = shard_counter
+            else:
+                counter.merge(shard_counter)
+            if progress is not None:
+                progress(done / len(futures))
+    except BaseException:
+        terminate_pool(executor)
+        raise
+    executor.shutdown()
+
+    return counter.result()
+
+
+def count_file(file_path, mode, connecting_words=(), progress=None, cancel=None, approximate=None):
+    """Alege între numărarea în flux și cea paralelă în funcție de mărimea fișierului."""
+    if os.path.getsize(file_path) > PARALLEL_THRESHOLD:
+        return count_file_parallel(file_path, mode, connecting_words, progress=progress, cancel=cancel,
+                                   approximate=approximate)
+    return count_file_stream(file_path, mode, connecting_words, progress=progress, cancel=cancel,
+                             approximate=approximate)
+
+
+class FileFollower:
+    """Numără un fișier care crește (de exemplu un log): fiecare apel citește doar octeții adăugați.
+
+    Ultimul cuvânt, dacă nu este urmat încă de un spațiu alb, așteaptă următoarea
+    citire, dar apare în result() ca la sfârșitul fișierului. Dacă fișierul este trunchiat sau înlocuit (rotația logurilor),
+    numărarea reîncepe de la zero.
+    """
+
+    def __init__(self, file_path, mode=MULTI_MODE, connecting_words=(), approximate=None, encoding="utf-8"):
+        self.file_path = file_path
+        self.mode = mode
+        self.connecting_words = connecting_words
+        self.approximate = approximate
+        self.encoding = encoding
+        self.identity = None
+        self.reset()
+
+    def reset(self):
+        self.offset = 0
+        self.decoder = codecs.getincrementaldecoder(self.encoding)()
+        self.remainder = ""
+        self.counter = make_counter(self.mode, self.connecting_words, self.approximate)
+
+    def read_new(self, limit=CHUNK_SIZE * 8):
+        """Citește cel mult limit octeți noi; întoarce câți octeți au fost citiți"""
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return 0  # Fișierul rotit nu a fost încă recreat
+        identity = (stat.st_dev, stat.st_ino)
+        if identity != self.identity or stat.st_size < self.offset:
+            self.identity = identity
+            self.reset()
+        if stat.st_size == self.offset:
+            return 0
+
+        with open(self.file_path, "rb") as file:
+            file.seek(self.offset)
+            raw = file.read(min(limit, stat.st_size - self.offset))
+        self.offset += len(raw)
+
+        complete, self.remainder = split_at_whitespace(self.remainder + self.decoder.decode(raw),
+                                                        len(self.remainder))
+        if complete:
+            self.counter.update(complete)
+        return len(raw)
+
+    def result(self):
+        # Ultimul cuvânt (fără spațiu alb după el) este numărat ca la sfârșitul unui fișier, pe o copie
+        # a contorului: citirea următoare îl poate continua
+        if not self.remainder:
+            return self.counter.result()
+        counter = copy.deepcopy(self.counter)
+        counter.update(self.remainder)
+        return counter.result()
+
+
+def grown_prefix(needed, current):
+    """Lungimea până la care se extinde un prefix al clasamentului (RankedItems, CompactRanked).
+
+    Prefixul crește geometric, ca derularea rând cu rând să nu recalculeze
+    selecția la fiecare pas.
+    """
+    return max(needed, 2 * current)
+
+
+def rank_items(counts):
+    """Sortează elementele descrescător după frecvență."""
+    return sorted(counts.items(), key=itemgetter(1), reverse=True)
+
+
+def top_items(counts, k):
+    """Primele k elemente după frecvență, fără a sorta tot vocabularul.
+
+    heapq.nlargest este echivalent cu sorted(..., reverse=True)[:k], deci la
+    egalitate se păstrează ordinea primei apariții, exact ca în rank_items.
+    """
+    return heapq.nlargest(k, counts.items(), key=itemgetter(1))
+
+
+class RankedItems:
+    """Elementele sortate descrescător după frecvență, calculate la cerere.
+
+    Se comportă ca lista întoarsă de rank_items, dar graficele și prima pagină
+    din tabel folosesc doar selecția parțială (top_items); sortarea completă
+    are loc doar când se cere un element aflat mai departe în clasament.
+    """
+
+    def __init__(self, counts):
+        self.counts = counts
+        self.prefix = []  # Primele len(self.prefix) elemente din clasament
+        self.complete = False
+
+    @classmethod
+    def from_ranked(cls, ranked):
+        """Construiește clasamentul dintr-o listă deja sortată (de exemplu din cache)"""
+        items = cls(Counter(dict(ranked)))
+        items.prefix = list(ranked)
+        items.complete = True
+        return items
+
+    def __len__(self):
+        return len(self.counts)
+
+    def top(self, k):
+        k = min(k, len(self.counts))
+        if k > len(self.prefix) and not self.complete:
+            if k >= len(self.counts) // 4:
+                # Aproape tot vocabularul: sortarea completă e mai ieftină
+                self.prefix = rank_items(self.counts)
+                self.complete = True
+            else:
+                self.prefix = top_items(self.counts, k)
+        return self.prefix[:k]
+
+    def ranked(self):
+        """Clasamentul complet (de exemplu pentru export)"""
+        return self.top(len(self.counts))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            # Pozițiile atinse, în orice sens; prefixul trebuie să ajungă până la cea mai mare
+            positions = range(len(self))[index]
+            if not positions:
+                return []
+            self.top(max(positions[0], positions[-1]) + 1)
+            return self.prefix[positions[0]::positions.step][:len(positions)]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("index în afara clasamentului")
+        if index >= len(self.prefix):
+            self.top(grown_prefix(index + 1, len(self.prefix)))
+        return self.prefix[index]
+
+    def __iter__(self):
+        return iter(self.ranked())
@@ -0,0 +1,274 @@
+"""Analiză în lot, fără interfață grafică.
+
+Exemple:
+    python batch.py corpus/ --mode words --output-dir rezultate
+    python batch.py "date/**/*.csv" --mode numbers --mode letters --format json --jobs 8
+    python batch.py raport.xlsx --column Descriere --top 100
+    python batch.py corpus/ --mode words --charts png --dpi 150
+    python batch.py corpus/ --ngrams 2 --ngrams 3 --top 50
+"""
+import argparse
+import csv
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from analysis import (ANALYSIS_MODES, CONNECTING_WORDS, MULTI_MODE, STREAMING_THRESHOLD, count_file_stream,
+                      count_string)
+from charts import CHART_FORMATS, DEFAULT_DPI, export_charts, prepare_chart_data
+from excel_loader import read_excel_columns, read_excel_column
+from frame_analysis import count_csv, count_frame, numeric_stats
+from ngrams import ngram_mode
+from sketch import DEFAULT_DELTA
+from stopwords import DEFAULT_LANGUAGES, available_languages, load_stopwords
+from token_store import CompactRanked, TokenCounts
+
+SUPPORTED_EXTENSIONS = (".txt", ".csv", ".xlsx", ".xls")
+
+
+def expand_paths(patterns):
+    """Transformă argumentele (fișiere, directoare sau glob-uri) într-o listă de fișiere"""
+    files = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for directory, _, names in os.walk(pattern):
+                files.extend(os.path.join(directory, name) for name in sorted(names)
+                             if name.lower().endswith(SUPPORTED_EXTENSIONS))
+        elif os.path.isfile(pattern):
+            files.append(pattern)
+        else:
+            files.extend(path for path in sorted(glob.glob(pattern, recursive=True)) if os.path.isfile(path))
+
+    # Eliminăm duplicatele păstrând ordinea
+    return list(dict.fromkeys(files))
+
+
+def count_path(file_path, mode, connecting_words=CONNECTING_WORDS, column=None, approximate=None):
+    """Numără conținutul unui fișier exact ca interfața grafică (extended.py)
+
+    approximate = (epsilon, delta) se aplică doar fișierelor text, ca în interfață.
+    """
+    file_ext = os.path.splitext(file_path)[1].lower()
+
+    if file_ext == ".csv":
+        import pandas as pd
+        try:
+            if os.path.getsize(file_path) > STREAMING_THRESHOLD:
+                # Pe bucăți, în procesul curent (fișierele sunt deja repartizate pe procese)
+                return count_csv(file_path, mode, connecting_words, workers=1)
+            return count_frame(pd.read_csv(file_path), mode, connecting_words)
+        except (pd.errors.ParserError, pd.errors.EmptyDataError, UnicodeDecodeError):
+            # La fel ca în interfață: dacă parsarea eșuează, fișierul este tratat ca text
+            return count_file_stream(file_path, mode, connecting_words)
+
+    if file_ext in (".xlsx", ".xls"):
+        if column is None:
+            raise ValueError("pentru fișierele Excel trebuie indicată coloana (--column)")
+        engine = "xlrd" if file_ext == ".xls" else "openpyxl"
+        if str(column) not in [str(name) for name in read_excel_columns(file_path, engine)]:
+            raise ValueError(f"coloana '{column}' nu există")
+        return count_frame(read_excel_column(file_path, column, engine), mode, connecting_words)
+
+    # Numerele sunt căutate direct în octeții fișierului mapat în memorie, fără decodarea întregului text
+    if mode == "numbers" or os.path.getsize(file_path) > STREAMING_THRESHOLD:
+        return count_file_stream(file_path, mode, connecting_words, approximate=approximate)
+    with open(file_path, "r", encoding="utf-8") as file:
+        return count_string(file.read(), mode, connecting_words, approximate=approximate)
+
+
+def analyze_path(file_path, modes, column=None, approximate=None, charts=False, connecting_words=CONNECTING_WORDS):
+    """Rulează într-un proces separat; întoarce ({mod: (TokenCounts, total_elemente, total_jetoane)}, statistici)
+
+    Frecvențele sunt trimise înapoi în forma compactă, mult mai ieftin de serializat decât un Counter.
+    Statisticile numerice (pentru histograma din grafice) sunt calculate doar pentru o coloană Excel
+    numerică, ca în interfață, și doar dacă se exportă grafice.
+    """
+    # Tipurile de bază sunt numărate dintr-o singură citire, n-gramele separat
+    basic = [mode for mode in modes if mode in ANALYSIS_MODES]
+    if len(basic) > 1:
+        counted = count_path(file_path, MULTI_MODE, connecting_words, column, approximate)
+    else:
+        counted = {mode: count_path(file_path, mode, connecting_words, column, approximate) for mode in basic}
+    for mode in modes:
+        if mode not in ANALYSIS_MODES:
+            counted[mode] = count_path(file_path, mode, connecting_words, column, approximate)
+
+    stats = None
+    file_ext = os.path.splitext(file_path)[1].lower()
+    if charts and "numbers" in modes and column is not None and file_ext in (".xlsx", ".xls"):
+        engine = "xlrd" if file_ext == ".xls" else "openpyxl"
+        stats = numeric_stats(read_excel_column(file_path, column, engine))
+
+    return {
+        mode: (TokenCounts.from_counter(counted[mode][0]), *counted[mode][1:])
+        for mode in modes
+    }, stats
+
+
+def result_rows(store, total_items, top=None):
+    ids = store.ranked_order() if top is None else store.top_ids(top)
+    percentages = store.percentages(total_items)[ids].tolist()
+    for rank, ((item, count), percentage) in enumerate(zip(store.items_at(ids), percentages), 1):
+        yield rank, item, count, round(percentage, 4)
+
+
+def has_errors(results):
+    """Rezultatele conțin frecvențe aproximative (cu eroare garantată)"""
+    return any(counts.max_error is not None for modes in results.values() for counts, _, _ in modes.values())
+
+
+def write_csv(path, results, top):
+    # Coloana max_error apare doar pentru --approximate, ca formatul exact să rămână neschimbat
+    errors = has_errors(results)
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["file", "mode", "rank", "item", "count", "percentage", "total_items", "total_tokens"]
+                        + (["max_error"] if errors else []))
+        for name, modes in results.items():
+            for mode, (counts, total_items, total_tokens) in modes.items():
+                extra = [counts.max_error or 0] if errors else []
+                for row in result_rows(counts, total_items, top):
+                    writer.writerow([name, mode, *row, total_items, total_tokens, *extra])
+
+
+def write_json(path, results, top):
+    data = {
+        name: {
+            mode: {
+                "total_items": total_items,
+                "total_tokens": total_tokens,
+                **({} if counts.max_error is None else {"max_error": counts.max_error}),
+                "items": [[item, count, percentage] for _, item, count, percentage
+                          in result_rows(counts, total_items, top)],
+            }
+            for mode, (counts, total_items, total_tokens) in modes.items()
+        }
+        for name, modes in results.items()
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(data, file, ensure_ascii=False, indent=1)
+
+
+def chart_name(path):
+    """Numele fișierului de grafic derivat din calea analizată (directoarele devin '_').
+
+    Dacă numele a fost modificat, primește un sufix din hash-ul căii, ca două căi
+    diferite ("a b.txt" și "a_b.txt", "x/y.txt" și "x_y.txt") să nu se suprascrie.
+    """
+    path = os.path.normpath(path)
+    name = re.sub(r"[^\w.-]+", "_", path).strip("_")
+    if name == path:
+        return name
+    return f"{name}-{hashlib.sha256(os.fsencode(path)).hexdigest()[:8]}"
+
+
+def chart_jobs(chart_dir, results, stats, chart_format, column=None):
+    """Câte un grafic pentru fiecare fișier și tip de analiză, cu aceleași date ca în interfață"""
+    for name, modes in results.items():
+        for mode, (counts, total_items, _) in modes.items():
+            if not len(counts):
+                continue
+            data = prepare_chart_data(CompactRanked(counts), total_items, mode)
+            path = os.path.join(chart_dir, f"{chart_name(name)}.{mode}.{chart_format}")
+            yield path, data, stats.get(name), column
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Statistici de frecvență pentru mai multe fișiere, fără interfață")
+    parser.add_argument("paths", nargs="+", help="fișiere, directoare sau glob-uri (de ex. 'date/**/*.txt')")
+    parser.add_argument("--mode", action="append", choices=ANALYSIS_MODES,
+                        help="tipul de analiză (se poate repeta; implicit words)")
+    parser.add_argument("--ngrams", action="append", type=int, metavar="N",
+                        help="n-gramele de cuvinte, după eliminarea cuvintelor de legătură (se poate repeta)")
+    parser.add_argument("--column", help="coloana analizată pentru fișierele Excel")
+    parser.add_argument("--stopwords", action="append", metavar="LANG",
+                        help="lista de cuvinte de legătură excluse: o limbă din stopwords/ "
+                             f"({', '.join(available_languages())}) sau un fișier propriu; "
+                             f"se poate repeta (implicit {' și '.join(DEFAULT_LANGUAGES)})")
+    parser.add_argument("--format", choices=("csv", "json"), default="csv", help="formatul rezultatelor")
+    parser.add_argument("--output-dir", default=".", help="directorul în care se scriu rezultatele")
+    parser.add_argument("--top", type=int, help="câte elemente se scriu pentru fiecare fișier")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="numărul de procese")
+    parser.add_argument("--approximate", type=float, metavar="EPSILON",
+                        help="numărare aproximativă cu memorie fixă pentru fișierele text (de ex. 0.0001); "
+                             "fiecare frecvență este supraestimată cu cel mult max_error")
+    parser.add_argument("--delta", type=float, default=DEFAULT_DELTA,
+                        help="probabilitatea ca estimarea Count-Min să depășească ε·N (cu --approximate)")
+    parser.add_argument("--charts", choices=CHART_FORMATS,
+                        help="salvează și graficele (ca în interfață) în OUTPUT_DIR/charts, în formatul dat")
+    parser.add_argument("--dpi", type=int, default=DEFAULT_DPI, help="rezoluția graficelor salvate")
+    args = parser.parse_args(argv)
+    if args.approximate is not None and not 0 < args.approximate < 1:
+        parser.error("EPSILON trebuie să fie între 0 și 1")
+    if not 0 < args.delta < 1:
+        parser.error("--delta trebuie să fie între 0 și 1")
+    approximate = None if args.approximate is None else (args.approximate, args.delta)
+    try:
+        connecting_words = CONNECTING_WORDS if args.stopwords is None else load_stopwords(args.stopwords)
+    except ValueError as e:
+        parser.error(str(e))
+
+    try:
+        ngram_modes = [ngram_mode(n) for n in args.ngrams or ()]
+    except ValueError as e:
+        parser.error(str(e))
+    modes = tuple(dict.fromkeys([*(args.mode or ()), *ngram_modes] or ["words"]))
+    files = expand_paths(args.paths)
+    if not files:
+        parser.error("nu s-a găsit niciun fișier")
+
+    results = {}
+    stats = {}
+    aggregate = {mode: [[], 0, 0] for mode in modes}
+    failed = 0
+
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = {executor.submit(analyze_path, path, modes, args.column, approximate, args.charts is not None,
+                                   connecting_words): path
+                   for path in files}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                results[path], stats[path] = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"Eroare {path}: {e}", file=sys.stderr)
+                continue
+            print(f"Analizat: {path}", file=sys.stderr)
+
+    # Ordinea fișierelor în rezultate (și în agregat) nu depinde de ordinea terminării
+    results = {path: results[path] for path in files if path in results}
+    for modes_result in results.values():
+        for mode, (counts, total_items, total_tokens) in modes_result.items():
+            aggregate[mode][0].append(counts)
+            aggregate[mode][1] += total_items
+            aggregate[mode][2] += total_tokens
+    # Frecvențele tuturor fișierelor sunt combinate o singură dată, cu un singur index
+    for values in aggregate.values():
+        values[0] = TokenCounts.combine(values[0])
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    write = write_csv if args.format == "csv" else write_json
+    write(os.path.join(args.output_dir, f"results.{args.format}"), results, args.top)
+    aggregate = {"*": {mode: tuple(values) for mode, values in aggregate.items()}}
+    write(os.path.join(args.output_dir, f"aggregate.{args.format}"), aggregate, args.top)
+
+    if args.charts:
+        chart_dir = os.path.join(args.output_dir, "charts")
+        os.makedirs(chart_dir, exist_ok=True)
+        jobs = [*chart_jobs(chart_dir, results, stats, args.charts, args.column),
+                *chart_jobs(chart_dir, {"aggregate": aggregate["*"]}, {}, args.charts)]
+        for path, error in export_charts(jobs, args.dpi, args.jobs):
+            if error is not None:
+                failed += 1
+                print(f"Eroare grafic {path}: {error}", file=sys.stderr)
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
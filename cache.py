@@ -0,0 +1,170 @@
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import zlib
+from contextlib import contextmanager
+
+from token_store import TokenCounts
+
+# Directorul și mărimea maximă a cache-ului persistent
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "statistical-graphs")
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+HASH_BLOCK_SIZE = 1024 * 1024
+
+# Se incrementează când se schimbă modul de numărare, ca rezultatele vechi să nu mai fie folosite
+CACHE_VERSION = 8
+
+
+class AnalysisCache:
+    """Cache persistent (SQLite) pentru rezultatele analizelor.
+
+    Intrările sunt identificate prin hash-ul conținutului fișierului, tipul de
+    analiză, tipul sursei, coloana Excel și cuvintele de legătură. Când mărimea
+    totală depășește max_bytes, se elimină intrările folosite cel mai demult.
+    """
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.path = os.path.join(directory, "analysis.sqlite")
+        os.makedirs(directory, exist_ok=True)
+        with self.connect() as db:
+            db.execute("""CREATE TABLE IF NOT EXISTS entries (
+                              key TEXT PRIMARY KEY,
+                              content_hash TEXT NOT NULL,
+                              data BLOB NOT NULL,
+                              size INTEGER NOT NULL,
+                              last_used REAL NOT NULL)""")
+            db.execute("CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used)")
+            db.execute("""CREATE TABLE IF NOT EXISTS hashes (
+                              path TEXT PRIMARY KEY,
+                              size INTEGER NOT NULL,
+                              mtime_ns INTEGER NOT NULL,
+                              content_hash TEXT NOT NULL)""")
+
+    @contextmanager
+    def connect(self):
+        # O conexiune nouă la fiecare operație, ca obiectul să poată fi folosit din orice fir
+        db = sqlite3.connect(self.path, timeout=10)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def known_hash(self, file_path):
+        """Hash-ul deja calculat al fișierului, dacă mărimea și data nu s-au schimbat; altfel None (fără citire)"""
+        file_path = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+        with self.connect() as db:
+            row = db.execute("SELECT size, mtime_ns, content_hash FROM hashes WHERE path = ?",
+                             (file_path,)).fetchone()
+        if row is not None and row[0] == stat.st_size and row[1] == stat.st_mtime_ns:
+            return row[2]
+        return None
+
+    def content_hash(self, file_path):
+        """SHA-256 al conținutului; recalculat doar dacă mărimea sau data fișierului s-au schimbat"""
+        known = self.known_hash(file_path)
+        if known is not None:
+            return known
+
+        file_path = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as file:
+            for block in iter(lambda: file.read(HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+        content_hash = digest.hexdigest()
+
+        with self.connect() as db:
+            db.execute("INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?)",
+                       (file_path, stat.st_size, stat.st_mtime_ns, content_hash))
+        return content_hash
+
+    @staticmethod
+    def make_key(content_hash, mode, source, column=None, connecting_words=()):
+        parts = [CACHE_VERSION, content_hash, mode, source, None if column is None else str(column), sorted(connecting_words)]
+        return hashlib.sha256(json.dumps(parts, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+    def contains(self, key):
+        with self.connect() as db:
+            return db.execute("SELECT 1 FROM entries WHERE key = ?", (key,)).fetchone() is not None
+
+    def load(self, key):
+        """Întoarce (TokenCounts, total_elemente, total_jetoane) sau None"""
+        with self.connect() as db:
+            row = db.execute("SELECT data FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            db.execute("UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), key))
+
+        header, _, counts = zlib.decompress(row[0]).partition(b"\n")
+        total_items, total_tokens = json.loads(header)
+        return TokenCounts.from_bytes(counts), total_items, total_tokens
+
+    def store(self, key, content_hash, counts, total_items, total_tokens):
+        """Salvează frecvențele (TokenCounts) în forma lor binară: fără decodare și fără clasament"""
+        header = json.dumps([total_items, total_tokens]).encode("utf-8")
+        data = zlib.compress(header + b"\n" + counts.to_bytes())
+        if len(data) > self.max_bytes:
+            return
+        with self.connect() as db:
+            db.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                       (key, content_hash, data, len(data), time.time()))
+        self.evict()
+
+    def evict(self):
+        """Elimină intrările folosite cel mai demult până când cache-ul încape în max_bytes"""
+        with self.connect() as db:
+            total = db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            for key, size in db.execute("SELECT key, size FROM entries ORDER BY last_used").fetchall():
+                db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                total -= size
+                if total <= self.max_bytes:
+                    break
+
+    def invalidate(self, content_hash=None):
+        """Șterge intrările unui fișier (după hash) sau, fără argument, tot cache-ul"""
+        with self.connect() as db:
+            if content_hash is None:
+                db.execute("DELETE FROM entries")
+                db.execute("DELETE FROM hashes")
+            else:
+                db.execute("DELETE FROM entries WHERE content_hash = ?", (content_hash,))
+        with self.connect() as db:
+            db.execute("VACUUM")
+
+    def size(self):
+        with self.connect() as db:
+            return db.execute("SELECT COALESCE(SUM(size), 0), COUNT(*) FROM entries").fetchone()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gestionează cache-ul analizelor")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    invalidate_parser = subparsers.add_parser("invalidate", help="șterge rezultatele din cache")
+    invalidate_parser.add_argument("files", nargs="*", help="fișierele de invalidat (implicit tot cache-ul)")
+    subparsers.add_parser("info", help="afișează mărimea cache-ului")
+    args = parser.parse_args()
+
+    cache = AnalysisCache()
+    if args.command == "invalidate":
+        if args.files:
+            for file_path in args.files:
+                cache.invalidate(cache.content_hash(file_path))
+        else:
+            cache.invalidate()
+    else:
+        size, entries = cache.size()
+        print(f"{cache.path}: {entries} intrări, {size / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
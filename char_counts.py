@@ -0,0 +1,125 @@
+"""Histograme de caractere vectorizate (NumPy), pentru analizele "letters" și "all".
+
+Textul este văzut ca tablou de puncte de cod (UTF-32), numărat cu np.bincount
+într-un tablou dens pentru planul multilingv de bază (U+0000-U+FFFF, inclusiv
+ă, â, î, ș, ț); caracterele din afara lui (emoji etc.) sunt rare și sunt numărate
+separat. Clasele de caractere sunt măști booleene precalculate, indexate după
+punctul de cod. Ordinea primei apariții este păstrată, ca la un Counter, deci
+clasamentul (inclusiv ordinea egalităților) nu se schimbă.
+"""
+from collections import Counter
+from functools import lru_cache
+
+from deferred import load_numpy
+
+# Planul multilingv de bază: un contor pentru fiecare punct de cod
+BMP_SIZE = 0x10000
+
+# Ce caractere numără fiecare tip de analiză (textul este deja normalizat de tokenizer.normalize):
+# literele Unicode, deci și diacriticele, respectiv literele și cifrele
+CHAR_CLASSES = {
+    "letters": str.isalpha,
+    "all": str.isalnum,
+}
+
+
+@lru_cache(maxsize=None)
+def class_mask(kind):
+    """Masca unei clase de caractere: mask[cod] este True dacă caracterul aparține clasei"""
+    np = load_numpy()
+    belongs = CHAR_CLASSES[kind]
+    return np.fromiter((belongs(chr(code)) for code in range(BMP_SIZE)), dtype=bool, count=BMP_SIZE)
+
+
+def code_points(text):
+    # surrogatepass: și un surogat izolat rămâne un singur punct de cod
+    return load_numpy().frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype="<u4")
+
+
+class CharCounts:
+    """Numărul fiecărui caracter, acumulat bloc cu bloc; se folosește în locul unui Counter de caractere"""
+
+    def __init__(self):
+        np = load_numpy()
+        self.counts = np.zeros(BMP_SIZE, dtype=np.int64)
+        self.seen = np.zeros(BMP_SIZE, dtype=bool)
+        self.astral = {}  # Caracterele din afara planului de bază: cod -> număr
+        self.order = []  # Punctele de cod în ordinea primei apariții
+
+    def update(self, text):
+        """Adaugă caracterele unui text sau, ca Counter.update, numărătorile altui CharCounts"""
+        if isinstance(text, CharCounts):
+            self.merge(text)
+            return
+        np = load_numpy()
+        codes = code_points(text)
+        if not len(codes):
+            return
+
+        astral = None
+        if codes.max() >= BMP_SIZE:
+            astral = Counter(codes[codes >= BMP_SIZE].tolist())
+            block = np.bincount(codes[codes < BMP_SIZE], minlength=BMP_SIZE)
+        else:
+            block = np.bincount(codes, minlength=BMP_SIZE)
+
+        new = (block > 0) & ~self.seen
+        new_astral = astral is not None and any(code not in self.astral for code in astral)
+        if new_astral or new.any():
+            self.add_new(codes, new, new_astral)
+
+        self.counts += block
+        if astral is not None:
+            for code, count in astral.items():
+                self.astral[code] = self.astral.get(code, 0) + count
+
+    def add_new(self, codes, new, new_astral):
+        """Adaugă la ordine caracterele noi din bloc, în ordinea în care apar în bloc"""
+        np = load_numpy()
+        lookup = np.append(new, new_astral)  # Ultima poziție reprezintă toate caracterele din afara planului
+        positions = np.flatnonzero(lookup[np.minimum(codes, BMP_SIZE)])
+        candidates, first = np.unique(codes[positions], return_index=True)
+        for code in candidates[np.argsort(first)].tolist():
+            if code < BMP_SIZE:
+                self.seen[code] = True
+                self.order.append(code)
+            elif code not in self.astral:
+                self.astral[code] = 0
+                self.order.append(code)
+
+    def merge(self, other):
+        """Ca Counter.update: caracterele noi din other se adaugă după cele existente"""
+        for code in other.order:
+            if code < BMP_SIZE:
+                if not self.seen[code]:
+                    self.seen[code] = True
+                    self.order.append(code)
+            elif code not in self.astral:
+                self.astral[code] = 0
+                self.order.append(code)
+        self.counts += other.counts
+        for code, count in other.astral.items():
+            self.astral[code] += count
+
+    def select(self, kind):
+        """(Counter, total, total) pentru caracterele unei clase din CHAR_CLASSES, în ordinea primei apariții"""
+        np = load_numpy()
+        order = np.asarray(self.order, dtype=np.int64)
+        in_plane = order < BMP_SIZE
+        keep = np.zeros(len(order), dtype=bool)
+        keep[in_plane] = class_mask(kind)[order[in_plane]]
+        counts = np.zeros(len(order), dtype=np.int64)
+        counts[in_plane] = self.counts[order[in_plane]]
+
+        belongs = CHAR_CLASSES[kind]
+        for i in np.flatnonzero(~in_plane).tolist():
+            keep[i] = belongs(chr(self.order[i]))
+            counts[i] = self.astral[self.order[i]]
+
+        chars = Counter(dict(zip(map(chr, order[keep].tolist()), counts[keep].tolist())))
+        total = int(counts[keep].sum())
+        return chars, total, total
+
+    def split(self):
+        """Rezultatele ambelor analize de caractere, ca în MultiModeCounter"""
+        return {kind: self.select(kind) for kind in CHAR_CLASSES}
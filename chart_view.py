@@ -0,0 +1,43 @@
+import tkinter as tk
+
+from charts import ChartRenderer
+from deferred import load_tk_canvas
+
+
+class ChartView(tk.Frame):
+    """Tab-ul de grafice: o singură figură și un singur canvas pentru toată sesiunea.
+
+    Figura și canvas-ul sunt create la primul grafic; la generările următoare
+    ChartRenderer actualizează artiștii existenți, iar redesenarea este cerută
+    cu draw_idle (Tk o face o singură dată, la următorul ciclu de evenimente).
+    """
+
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+        self.renderer = None
+        self.canvas = None
+
+    def show(self, data, numeric_stats=None, column=None):
+        if self.renderer is None:
+            # matplotlib se încarcă abia la primul grafic
+            self.renderer = ChartRenderer()
+            self.canvas = load_tk_canvas()(self.renderer.figure, master=self)
+            self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.renderer.render(data, numeric_stats, column)
+        self.canvas.draw_idle()
+
+    def has_chart(self):
+        return self.renderer is not None and self.renderer.has_chart()
+
+    def clear(self):
+        if self.renderer is not None:
+            self.renderer.clear()
+            self.canvas.draw_idle()
+
+    def destroy(self):
+        # Artiștii figurii sunt eliberați odată cu fereastra
+        if self.renderer is not None:
+            self.renderer.clear()
+            self.renderer = None
+            self.canvas = None
+        super().destroy()
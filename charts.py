@@ -0,0 +1,364 @@
+import math
+import os
+
+from deferred import load_colormap, load_figure
+from ngrams import NGRAM_KIND, ngram_size
+
+ITEM_TYPES = {
+    "words": "Cuvinte",
+    "numbers": "Numere",
+    "letters": "Litere",
+    "all": "Caractere",
+    NGRAM_KIND: "N-grame",
+}
+
+# Denumirile n-gramelor uzuale; celelalte sunt "<n>-grame"
+NGRAM_NAMES = {2: "Bigrame", 3: "Trigrame"}
+
+# Prag minim pentru a grupa valorile foarte mici în felia "Altele"
+MIN_SLICE_FRACTION = 0.02  # 2%
+
+# Mărimea figurii cu cele două grafice (inci)
+FIGURE_SIZE = (10, 8)
+
+# Exportul fără ecran: formatele acceptate (backend-ul Agg, SVG sau PDF) și rezoluția implicită
+CHART_FORMATS = ("png", "svg", "pdf")
+DEFAULT_DPI = 100
+
+# Diagrama pie: dispersarea feliilor și distanța etichetelor de procent față de centru
+PIE_EXPLODE = 0.05
+PIE_LABEL_RADIUS = 1.3
+PIE_LABEL_RADIUS_FAR = 1.5
+PIE_LABEL_MIN_DISTANCE = 0.2
+
+
+def item_type(analysis_type):
+    n = ngram_size(analysis_type)
+    if n:
+        return NGRAM_NAMES.get(n, f"{n}-grame")
+    return ITEM_TYPES.get(analysis_type, "Caractere")
+
+
+def prepare_chart_data(sorted_items, total_items, analysis_type):
+    """Pregătește datele pentru grafice fără a folosi matplotlib.
+
+    Poate rula pe firul de lucru; desenarea propriu-zisă rămâne pe firul Tk.
+    """
+    items_name = item_type(analysis_type)
+
+    # Limit to top items for clarity (more for letters since there are fewer)
+    top_limit = 10 if analysis_type != "letters" else 20
+    top_items = sorted_items[:min(top_limit, len(sorted_items))]
+
+    labels = [item for item, _ in top_items]
+    sizes = [count for _, count in top_items]
+
+    # Adăugăm procente la etichete pentru identificare ușoară
+    total = sum(sizes)
+    labels_with_pct = [f"{labels[i]} ({sizes[i] / total * 100:.1f}%)" for i in range(len(labels))]
+
+    # Grupăm valorile foarte mici într-o singură felie "Altele"
+    kept = [i for i, size in enumerate(sizes) if size / total >= MIN_SLICE_FRACTION]
+    others = sum(size for i, size in enumerate(sizes) if size / total < MIN_SLICE_FRACTION)
+
+    # Limitarea numărului de bare pentru claritate
+    display_limit = min(10, len(top_items))
+    bar_items = [item for item, _ in top_items[:display_limit]]
+    bar_frequencies = [count / total_items for _, count in top_items[:display_limit]]
+
+    return {
+        "analysis_type": analysis_type,
+        "item_type": items_name,
+        "shown": len(top_items),
+        "labels": labels,
+        "sizes": sizes,
+        "total": total,
+        "labels_with_pct": labels_with_pct,
+        "kept": kept,
+        "others": others,
+        "bar_items": bar_items,
+        "bar_frequencies": bar_frequencies,
+        # Numărare aproximativă: cu cât poate fi supraestimată fiecare frecvență
+        "max_error": getattr(sorted_items, "max_error", None),
+    }
+
+
+def pie_slices(data, colors):
+    """Feliile afișate: elementele peste prag și, dacă există, felia gri "Altele" """
+    sizes = [data["sizes"][i] for i in data["kept"]]
+    slice_colors = [colors[i] for i in data["kept"]]
+    if data["others"] > 0:
+        sizes.append(data["others"])
+        slice_colors.append("gray")
+    return sizes, slice_colors
+
+
+def pie_angles(sizes, start=90):
+    """Unghiurile (theta1, theta2) ale feliilor, calculate la fel ca Axes.pie"""
+    total = sum(sizes)
+    angles = []
+    theta1 = start
+    for size in sizes:
+        theta2 = theta1 + size / total * 360
+        angles.append((theta1, theta2))
+        theta1 = theta2
+    return angles
+
+
+def pie_label_positions(angles):
+    """Pentru fiecare felie: punctul de pe margine și poziția textului, depărtat dacă s-ar suprapune"""
+    positions = []
+    text_positions = []
+    for theta1, theta2 in angles:
+        angle = math.radians((theta2 - theta1) / 2 + theta1)  # Unghiul de mijloc al feliei
+        x = PIE_LABEL_RADIUS * math.cos(angle)
+        y = PIE_LABEL_RADIUS * math.sin(angle)
+        if any(math.hypot(x - px, y - py) < PIE_LABEL_MIN_DISTANCE for px, py in text_positions):
+            x = PIE_LABEL_RADIUS_FAR * math.cos(angle)
+            y = PIE_LABEL_RADIUS_FAR * math.sin(angle)
+        positions.append(((math.cos(angle), math.sin(angle)), (x, y)))
+        text_positions.append((x, y))
+    return positions
+
+
+class ChartRenderer:
+    """Figura cu cele două grafice ale unei analize, păstrată între generări.
+
+    Figura este creată fără pyplot, deci nu rămâne în registrul de figuri. Dacă
+    structura graficelor nu s-a schimbat (același tip de analiză, același număr
+    de felii și de bare), se actualizează doar datele artiștilor existenți
+    (unghiurile feliilor, înălțimile barelor, textele); altfel figura este
+    golită și redesenată. Aranjarea (tight_layout) se recalculează la fiecare
+    desenare, pornind de la parametrii impliciți: depinde de toate textele
+    (legendă, etichete, titluri, valorile axelor) și de poziția adnotărilor,
+    deci o figură actualizată arată la fel ca una desenată de la zero. Desenarea
+    pe ecran sau în fișier rămâne în grija apelantului (canvas.draw_idle,
+    figure.savefig).
+    """
+
+    def __init__(self, figsize=FIGURE_SIZE, dpi=None):
+        self.figure = load_figure()(figsize=figsize, dpi=dpi)
+        self.default_layout = dict(vars(self.figure.subplotpars))
+        self.structure = None
+        self.artists = {}
+
+    def has_chart(self):
+        return self.structure is not None
+
+    def clear(self):
+        self.figure.clear()
+        self.structure = None
+        self.artists = {}
+
+    def render(self, data, numeric_stats=None, column=None):
+        """Desenează datele din prepare_chart_data; numeric_stats înlocuiește diagrama pie cu histograma"""
+        histogram = numeric_stats is not None and data["analysis_type"] == "numbers"
+        colors = load_colormap("Blues")([(i + 1) / (len(data["labels"]) + 1) for i in range(len(data["labels"]))])
+        slices = None if histogram else pie_slices(data, colors)
+        structure = (
+            data["analysis_type"],
+            len(numeric_stats["histogram"][0]) if histogram else len(slices[0]),
+            len(data["labels"]),
+            len(data["bar_items"]),
+            data["max_error"] is None,
+        )
+
+        if structure != self.structure:
+            self.clear()
+            top = self.figure.add_subplot(211)
+            if histogram:
+                self.draw_histogram(top, numeric_stats, column)
+            else:
+                self.draw_pie(top, data, colors, slices)
+            self.draw_bars(self.figure.add_subplot(212), data)
+            self.structure = structure
+        else:
+            if histogram:
+                self.update_histogram(numeric_stats, column)
+            else:
+                self.update_pie(data, slices)
+            self.update_bars(data)
+
+        self.adjust_layout()
+
+    def adjust_layout(self):
+        # Pornim de la parametrii impliciți, ca aranjarea să nu depindă de graficele anterioare;
+        # apoi lăsăm spațiu în dreapta pentru legenda diagramei pie
+        self.figure.subplots_adjust(**self.default_layout)
+        self.figure.tight_layout()
+        self.figure.subplots_adjust(right=0.75)
+
+    def draw_pie(self, ax, data, colors, slices):
+        sizes, slice_colors = slices
+        wedges, _ = ax.pie(
+            sizes,
+            labels=None,
+            startangle=90,
+            colors=slice_colors,
+            wedgeprops={'edgecolor': 'w', 'linewidth': 1},
+            explode=[PIE_EXPLODE] * len(sizes)  # Dispersare ușoară
+        )
+
+        # Legenda în afara graficului, în dreapta
+        legend = ax.legend(
+            wedges,
+            data["labels_with_pct"][:len(wedges)],
+            title=f"Top {data['shown']} {data['item_type']}",
+            loc="center left",
+            bbox_to_anchor=(1, 0.5)
+        )
+
+        # Procentul fiecărei felii, cu o săgeată de culoarea feliei, chiar și pentru feliile foarte mici
+        annotations = []
+        angles = [(wedge.theta1, wedge.theta2) for wedge in wedges]
+        for i, (point, text_position) in enumerate(pie_label_positions(angles)):
+            annotations.append(ax.annotate(
+                f"{data['sizes'][i] / data['total'] * 100:.1f}%",
+                xy=point,
+                xytext=text_position,
+                arrowprops=dict(arrowstyle="->", connectionstyle="arc3,rad=0.1", color=colors[i]),
+                ha='center',
+                va='center'
+            ))
+
+        ax.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle
+        title = ax.set_title(f'Top {data["shown"]} {data["item_type"]} - Distribuție', y=1.25)
+        self.artists.update(pie_ax=ax, wedges=wedges, legend=legend, annotations=annotations, pie_title=title)
+
+    def update_pie(self, data, slices):
+        sizes, _ = slices
+        wedges = self.artists["wedges"]
+        angles = pie_angles(sizes)
+        for wedge, (theta1, theta2) in zip(wedges, angles):
+            middle = math.radians((theta1 + theta2) / 2)
+            wedge.set_center((PIE_EXPLODE * math.cos(middle), PIE_EXPLODE * math.sin(middle)))
+            wedge.set_theta1(theta1)
+            wedge.set_theta2(theta2)
+
+        for text, label in zip(self.artists["legend"].get_texts(), data["labels_with_pct"]):
+            text.set_text(label)
+        self.artists["legend"].set_title(f"Top {data['shown']} {data['item_type']}")
+
+        for i, (annotation, (point, text_position)) in enumerate(
+                zip(self.artists["annotations"], pie_label_positions(angles))):
+            annotation.xy = point
+            annotation.set_position(text_position)
+            annotation.set_text(f"{data['sizes'][i] / data['total'] * 100:.1f}%")
+        self.artists["pie_title"].set_text(f'Top {data["shown"]} {data["item_type"]} - Distribuție')
+        self.artists["pie_ax"].relim()
+        self.artists["pie_ax"].autoscale_view()
+
+    def draw_histogram(self, ax, stats, column):
+        counts, edges = stats["histogram"]
+        widths = [right - left for left, right in zip(edges, edges[1:])]
+        bins = ax.bar(edges[:-1], counts, width=widths, align="edge", color=load_colormap("Blues")(0.6),
+                      edgecolor="w")
+
+        # Media și mediana, pentru a vedea asimetria distribuției
+        mean = ax.axvline(stats["mean"], color="#f44336", linestyle="--", label=f"Medie: {stats['mean']:.4g}")
+        median = ax.axvline(stats["quantiles"][0.5], color="#FF9800", linestyle=":",
+                            label=f"Mediană: {stats['quantiles'][0.5]:.4g}")
+        legend = ax.legend(loc="upper right")
+
+        ax.set_title(f"Histogramă {column} ({stats['count']} valori)")
+        ax.set_xlabel("Valoare")
+        ax.set_ylabel("Număr de valori")
+        self.artists.update(histogram_ax=ax, bins=bins, mean=mean, median=median, histogram_legend=legend)
+
+    def update_histogram(self, stats, column):
+        ax = self.artists["histogram_ax"]
+        counts, edges = stats["histogram"]
+        for rectangle, count, left, right in zip(self.artists["bins"], counts, edges, edges[1:]):
+            rectangle.set_x(left)
+            rectangle.set_width(right - left)
+            rectangle.set_height(count)
+
+        median = stats["quantiles"][0.5]
+        self.artists["mean"].set_xdata([stats["mean"], stats["mean"]])
+        self.artists["median"].set_xdata([median, median])
+        mean_text, median_text = self.artists["histogram_legend"].get_texts()
+        mean_text.set_text(f"Medie: {stats['mean']:.4g}")
+        median_text.set_text(f"Mediană: {median:.4g}")
+
+        ax.set_title(f"Histogramă {column} ({stats['count']} valori)")
+        ax.relim()
+        ax.autoscale_view()
+
+    def draw_bars(self, ax, data):
+        # Poziții numerice cu etichete, ca barele să poată primi ulterior alte elemente
+        positions = range(len(data["bar_items"]))
+        bars = ax.bar(positions, data["bar_frequencies"], color=load_colormap("Blues")(0.6))
+        ax.set_xticks(positions, [str(item) for item in data["bar_items"]], rotation=45, ha='right')
+
+        # Valoarea deasupra fiecărei bare
+        values = [
+            ax.text(bar.get_x() + bar.get_width() / 2., bar.get_height(), f'{bar.get_height():.2f}',
+                    ha='center', va='bottom')
+            for bar in bars
+        ]
+
+        ax.set_title(self.bar_title(data))
+        ax.set_xlabel(f'{data["item_type"]}')
+        ax.set_ylabel('Frecvență')
+        self.artists.update(bar_ax=ax, bars=bars, bar_values=values)
+
+    def update_bars(self, data):
+        ax = self.artists["bar_ax"]
+        for bar, text, frequency in zip(self.artists["bars"], self.artists["bar_values"], data["bar_frequencies"]):
+            bar.set_height(frequency)
+            text.set_y(frequency)
+            text.set_text(f'{frequency:.2f}')
+        ax.set_xticks(range(len(data["bar_items"])), [str(item) for item in data["bar_items"]],
+                      rotation=45, ha='right')
+        ax.set_title(self.bar_title(data))
+        ax.set_xlabel(f'{data["item_type"]}')
+        ax.relim()
+        ax.autoscale_view()
+
+    @staticmethod
+    def bar_title(data):
+        if data["max_error"] is not None:
+            return f'Frecvențe {data["item_type"]} (aproximativ, eroare ≤ {data["max_error"]})'
+        return f'Frecvențe {data["item_type"]}'
+
+
+def save_charts(jobs, dpi=DEFAULT_DPI):
+    """Salvează graficele mai multor analize; jobs: [(cale, date, numeric_stats, coloană)].
+
+    Rulează într-un proces separat, fără ecran: formatul (și deci backend-ul)
+    este dat de extensia fișierului. Desenarea este aceeași ca în interfață;
+    figura este refolosită, dar golită înaintea fiecărui grafic, ca fișierul să
+    nu depindă de graficul anterior (deci nici de gruparea pe procese). Întoarce
+    [(cale, eroare sau None)].
+    """
+    renderer = ChartRenderer(dpi=dpi)
+    saved = []
+    for path, data, stats, column in jobs:
+        try:
+            renderer.clear()
+            renderer.render(data, stats, column)
+            renderer.figure.savefig(path, dpi=dpi)
+            saved.append((path, None))
+        except Exception as e:
+            saved.append((path, str(e)))
+    renderer.clear()
+    return saved
+
+
+def export_charts(jobs, dpi=DEFAULT_DPI, workers=None):
+    """Salvează graficele în paralel, pe procese; întoarce [(cale, eroare sau None)] în ordinea lucrărilor"""
+    from concurrent.futures import ProcessPoolExecutor
+
+    jobs = list(jobs)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) < 2:
+        return save_charts(jobs, dpi)
+
+    # Câte un grup de grafice pe lucrare, ca fiecare proces să-și refolosească figura;
+    # fiecare grafic este desenat de la zero, deci rezultatul nu depinde de grupare
+    groups = min(len(jobs), workers * 4)
+    size = math.ceil(len(jobs) / groups)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(save_charts, jobs[start:start + size], dpi)
+                   for start in range(0, len(jobs), size)]
+        return [saved for future in futures for saved in future.result()]
@@ -0,0 +1,77 @@
+import tkinter as tk
+from tkinter import ttk
+
+
+class ColumnSummary(tk.Frame):
+    """Comparație între coloane: totaluri și primele elemente ale fiecărei coloane.
+
+    Un rând pentru fiecare coloană din fiecare foaie (sau din fișierul CSV);
+    click pe antet sortează după coloana respectivă.
+    """
+
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+
+        self.rows = []  # (foaie, coloană, total, distincte, primele elemente)
+        self.sort_column = None
+        self.sort_reverse = False
+
+        self.summary_label = tk.Label(self, text="", justify=tk.LEFT, anchor=tk.W, font=("Arial", 10))
+        self.summary_label.pack(fill=tk.X, padx=5, pady=(5, 0))
+
+        table_frame = tk.Frame(self)
+        table_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        self.tree = ttk.Treeview(
+            table_frame,
+            columns=("sheet", "column", "total", "distinct", "top"),
+            show="headings",
+            selectmode="browse"
+        )
+        self.tree.column("sheet", width=100, anchor=tk.W)
+        self.tree.column("column", width=140, anchor=tk.W)
+        self.tree.column("total", width=80, anchor=tk.E)
+        self.tree.column("distinct", width=80, anchor=tk.E)
+        self.tree.column("top", width=400, anchor=tk.W)
+        for index, (name, text) in enumerate((("sheet", "Foaie"), ("column", "Coloană"), ("total", "Total"),
+                                              ("distinct", "Distincte"), ("top", "Primele elemente"))):
+            self.tree.heading(name, text=text, command=lambda index=index: self.sort_by(index))
+
+        scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+    def set_data(self, profiles, item_type):
+        """profiles: {(foaie, coloană): (primele_elemente, distincte, total_elemente, total_jetoane)}"""
+        self.rows = [
+            (str(sheet), str(column), total_items, distinct,
+             ", ".join(f"{item} ({count})" for item, count in top))
+            for (sheet, column), (top, distinct, total_items, _) in profiles.items()
+        ]
+        self.sort_column = None
+        sheets = len({sheet for sheet, _ in profiles})
+        total = sum(row[2] for row in self.rows)
+        self.summary_label.config(
+            text=f"{item_type}: {len(self.rows)} coloane din {sheets} foi, {total} elemente în total")
+        self.render()
+
+    def clear(self):
+        self.rows = []
+        self.summary_label.config(text="")
+        self.render()
+
+    def sort_by(self, index):
+        # Al doilea click pe același antet inversează ordinea; numerele descrescător implicit
+        if self.sort_column == index:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_column = index
+            self.sort_reverse = index in (2, 3)
+        self.rows.sort(key=lambda row: row[index], reverse=self.sort_reverse)
+        self.render()
+
+    def render(self):
+        self.tree.delete(*self.tree.get_children())
+        for row in self.rows:
+            self.tree.insert("", tk.END, values=row)
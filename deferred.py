@@ -0,0 +1,45 @@
+"""Importuri amânate pentru modulele grele.
+
+pandas, numpy și matplotlib sunt importate abia la primul fișier CSV/Excel
+sau la primul grafic, astfel încât fereastra apare imediat; după primul apel,
+modulul este luat din sys.modules.
+"""
+import importlib
+import importlib.util
+
+HEAVY_MODULES = ("pandas", "numpy", "matplotlib", "openpyxl", "xlrd")
+
+
+def module_available(name):
+    """Verifică dacă un modul poate fi importat, fără a-l importa"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def load_pandas():
+    return importlib.import_module("pandas")
+
+
+def load_numpy():
+    return importlib.import_module("numpy")
+
+
+def load_tk_canvas():
+    return importlib.import_module("matplotlib.backends.backend_tkagg").FigureCanvasTkAgg
+
+
+def load_figure():
+    """Figure fără pyplot: nu intră în registrul de figuri, deci este eliberată odată cu obiectul"""
+    return importlib.import_module("matplotlib.figure").Figure
+
+
+def load_colormap(name):
+    return importlib.import_module("matplotlib").colormaps[name]
+
+
+def loaded_heavy_modules():
+    """Modulele grele deja importate (folosit la măsurarea timpului de pornire)"""
+    import sys
+    return [name for name in HEAVY_MODULES if name in sys.modules]
@@ -0,0 +1,95 @@
+"""Citirea fișierelor Excel pe coloane.
+
+La deschidere se citește doar rândul de antet (pentru lista de coloane); după
+alegerea unei coloane se citesc doar celulele ei. Cu openpyxl foaia este
+parcursă în modul read-only, rând cu rând, deci memoria și timpul depind de o
+singură coloană, nu de întregul tabel.
+"""
+from deferred import load_pandas, load_numpy
+
+
+def header_names(values):
+    """Numele coloanelor ca în pandas: 'Unnamed: i' pentru celule goale, '.1', '.2' pentru duplicate"""
+    names = []
+    seen = {}
+    for i, value in enumerate(values):
+        name = f"Unnamed: {i}" if value is None else value
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def named_width(header):
+    """Numărul de coloane până la ultima celulă de antet completată"""
+    width = len(header)
+    while width and header[width - 1] is None:
+        width -= 1
+    return width
+
+
+def data_width(sheet, named, max_width):
+    """Numărul de coloane până la ultima care are date, căutată doar după primele named coloane"""
+    width = named
+    for row in sheet.iter_rows(min_row=2, min_col=named + 1, max_col=max_width, values_only=True):
+        width = max(width, named + named_width(row))
+        if width == max_width:
+            break
+    return width
+
+
+def read_excel_columns(file_path, engine="openpyxl"):
+    """Citește doar antetul primei foi"""
+    if engine == "openpyxl":
+        import openpyxl
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            sheet = workbook.worksheets[0]
+            header = list(next(sheet.iter_rows(min_row=1, max_row=1, values_only=True), ()))
+            width = named_width(header)
+            if width < len(header):
+                width = data_width(sheet, width, len(header))
+        finally:
+            workbook.close()
+        # Celulele goale de la capătul rândului sunt coloane doar dacă au date ("Unnamed: i", ca în pandas)
+        return header_names(header[:width])
+
+    return list(load_pandas().read_excel(file_path, engine=engine, nrows=0).columns)
+
+
+def read_excel_column(file_path, column, engine="openpyxl"):
+    """Citește o singură coloană din prima foaie, ca pandas.Series
+
+    column este numele coloanei, așa cum a fost întors de read_excel_columns.
+    Rândurile goale de la finalul coloanei sunt ignorate.
+    """
+    pd = load_pandas()
+    columns = read_excel_columns(file_path, engine)
+    index = [str(name) for name in columns].index(str(column))
+
+    if engine != "openpyxl":
+        return pd.read_excel(file_path, engine=engine, usecols=[index]).iloc[:, 0]
+
+    import openpyxl
+    np = load_numpy()
+    workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        values = [row[0] if row else None
+                  for row in sheet.iter_rows(min_row=2, min_col=index + 1, max_col=index + 1, values_only=True)]
+    finally:
+        workbook.close()
+
+    while values and values[-1] is None:
+        values.pop()
+
+    # Celulele goale devin NaN, ca la pandas.read_excel
+    return pd.Series([np.nan if value is None else value for value in values], name=columns[index])
+
+
+def read_excel_sheets(file_path, engine="openpyxl"):
+    """Toate foile, ca {nume_foaie: DataFrame} (pentru analiza tuturor coloanelor)"""
+    return load_pandas().read_excel(file_path, sheet_name=None, engine=engine)
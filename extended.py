@@ -1,15 +1,46 @@
+import time
+STARTUP_BEGIN = time.perf_counter()  # Pentru măsurarea timpului de pornire (--startup-time)
+
 import tkinter as tk
 from tkinter import filedialog, scrolledtext, ttk, messagebox
-import string
 import os
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import pandas as pd
-import re
-import numpy as np
-import openpyxl
-import xlrd
 import sys
+import queue
+import threading
+from analysis import (CONNECTING_WORDS, STREAMING_THRESHOLD, ANALYSIS_MODES, MULTI_MODE, AnalysisCancelled, RankedItems,
+                      FileFollower, count_string, count_file, top_items)
+from charts import item_type, prepare_chart_data
+from stats_table import StatsTable
+from token_store import CompactRanked
+from sketch import DEFAULT_DELTA, DEFAULT_EPSILON
+from preview import LazyPreview
+from cache import AnalysisCache
+from chart_view import ChartView
+from column_summary import ColumnSummary
+from excel_loader import read_excel_columns, read_excel_column, read_excel_sheets
+from frame_analysis import CSV_CHUNK_ROWS, count_columns, count_csv, count_frame, numeric_stats, profile_columns
+from ngrams import DEFAULT_NGRAM, NGRAM_KIND, NGRAM_SIZES, analysis_kind, ngram_mode
+from deferred import module_available, load_pandas, loaded_heavy_modules
+
+# Câte rezultate (fișier/coloană) păstrăm în memorie
+ANALYSIS_CACHE_SIZE = 8
+
+# Rezultatele parțiale (CSV mare): cât de des se actualizează tabelul și câte elemente arată
+PARTIAL_INTERVAL = 0.5
+PARTIAL_TOP = 1000
+
+# Urmărirea unui fișier care crește: cât de des se verifică fișierul și cât de des se actualizează afișarea
+FOLLOW_POLL = 0.5
+FOLLOW_REFRESH = 1.0
+
+# Antetele coloanelor din tabelul de statistici
+STATS_HEADINGS = {
+    "words": ("Cuvânt", "Număr"),
+    "numbers": ("Număr", "Apariții"),
+    "letters": ("Literă", "Apariții"),
+    "all": ("Caracter", "Apariții"),
+    NGRAM_KIND: ("N-gramă", "Număr"),
+}
 
 
 class TextAnalyzerApp:
@@ -24,16 +55,7 @@ class TextAnalyzerApp:
         self.root.geometry("1000x700")
 
         # Set of common connecting words to exclude
-        self.connecting_words = {
-            # English
-            "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "with",
-            "by", "of", "from", "as", "if", "then", "than", "when", "where", "why", "how",
-            "is", "are", "was", "were", "be", "been", "being", "this", "that", "these", "those",
-            # Romanian
-            "și", "sau", "dar", "în", "pe", "la", "cu", "de", "din", "ca", "dacă", "apoi",
-            "decât", "când", "unde", "de ce", "cum", "este", "sunt", "a fost", "au fost",
-            "fi", "fost", "fiind", "acest", "acel", "acești", "acei", "cel", "cea", "cei", "cele"
-        }
+        self.connecting_words = set(CONNECTING_WORDS)
 
         # Create the UI components
         self.create_widgets()
@@ -42,21 +64,24 @@ class TextAnalyzerApp:
         self.excel_engine = None
         self.check_excel_support()
 
-    def check_excel_support(self):
-        """Verifică disponibilitatea modulelor pentru Excel și alege motorul potrivit"""
+        # Cache persistent pe disc, după hash-ul conținutului
         try:
-            import openpyxl
+            self.disk_cache = AnalysisCache()
+        except Exception:
+            self.disk_cache = None  # De exemplu, directorul de cache nu poate fi creat
+
+    def check_excel_support(self):
+        """Verifică disponibilitatea modulelor pentru Excel și alege motorul potrivit (fără a le importa)"""
+        if module_available("openpyxl"):
             self.excel_engine = 'openpyxl'
             self.status_bar.config(text="Suport Excel: openpyxl")
-        except ImportError:
-            try:
-                import xlrd
-                self.excel_engine = 'xlrd'
-                self.status_bar.config(text="Suport Excel: xlrd (limitat la .xls)")
-            except ImportError:
-                self.excel_engine = None
-                self.status_bar.config(
-                    text="Avertisment: Nu s-a găsit suport pentru Excel. Instalați 'openpyxl' sau 'xlrd'.")
+        elif module_available("xlrd"):
+            self.excel_engine = 'xlrd'
+            self.status_bar.config(text="Suport Excel: xlrd (limitat la .xls)")
+        else:
+            self.excel_engine = None
+            self.status_bar.config(
+                text="Avertisment: Nu s-a găsit suport pentru Excel. Instalați 'openpyxl' sau 'xlrd'.")
 
     def create_widgets(self):
         # Frame for buttons
@@ -117,6 +142,61 @@ class TextAnalyzerApp:
         )
         self.clear_button.pack(side=tk.LEFT, padx=10)
 
+        # Cancel button - stops a running analysis
+        self.cancel_button = tk.Button(
+            button_frame,
+            text="⏹",
+            command=self.cancel_analysis,
+            width=2,
+            height=2,
+            bg="#9E9E9E",
+            fg="white",
+            font=("Arial", 12),
+            state=tk.DISABLED
+        )
+        self.cancel_button.pack(side=tk.LEFT, padx=10)
+
+        # Invalidate cache button - forces a fresh analysis of the current file
+        self.invalidate_button = tk.Button(
+            button_frame,
+            text="🗑",
+            command=self.invalidate_cache,
+            width=2,
+            height=2,
+            bg="#795548",
+            fg="white",
+            font=("Arial", 12)
+        )
+        self.invalidate_button.pack(side=tk.LEFT, padx=10)
+
+        # All columns button - analyzes every column of every sheet (or of the CSV) at once
+        self.columns_button = tk.Button(
+            button_frame,
+            text="📋",
+            command=self.analyze_all_columns,
+            width=2,
+            height=2,
+            bg="#607D8B",
+            fg="white",
+            font=("Arial", 12),
+            state=tk.DISABLED
+        )
+        self.columns_button.pack(side=tk.LEFT, padx=10)
+
+        # Follow button - keeps counting the lines appended to a growing text file
+        self.follow_button = tk.Button(
+            button_frame,
+            text="👁",
+            command=self.toggle_follow,
+            width=2,
+            height=2,
+            bg="#009688",
+            fg="white",
+            font=("Arial", 12),
+            state=tk.DISABLED
+        )
+        self.follow_button.pack(side=tk.LEFT, padx=10)
+
         # Analysis Type Frame
         analysis_type_frame = tk.Frame(button_frame)
         analysis_type_frame.pack(side=tk.LEFT, padx=20)
@@ -168,6 +248,45 @@ class TextAnalyzerApp:
         )
         self.all_radio.pack(side=tk.LEFT)
 
+        # N-grame de cuvinte: n ales din listă (bigrame, trigrame...)
+        self.ngrams_radio = tk.Radiobutton(
+            analysis_type_frame,
+            text="N-grame, n:",
+            variable=self.analysis_type,
+            value=NGRAM_KIND,
+            font=("Arial", 10)
+        )
+        self.ngrams_radio.pack(side=tk.LEFT)
+
+        self.ngram_var = tk.StringVar(value=str(DEFAULT_NGRAM))
+        ngram_spinbox = tk.Spinbox(
+            analysis_type_frame,
+            values=NGRAM_SIZES,
+            textvariable=self.ngram_var,
+            state="readonly",
+            width=2
+        )
+        ngram_spinbox.pack(side=tk.LEFT)
+
+        # Approximate counting - fixed memory, only the frequent items (text files)
+        self.approximate_var = tk.BooleanVar(value=False)
+        self.approximate_check = tk.Checkbutton(
+            analysis_type_frame,
+            text="Aproximativ, ε:",
+            variable=self.approximate_var,
+            font=("Arial", 10)
+        )
+        self.approximate_check.pack(side=tk.LEFT, padx=(10, 0))
+
+        self.epsilon_var = tk.StringVar(value=str(DEFAULT_EPSILON))
+        epsilon_entry = tk.Entry(analysis_type_frame, textvariable=self.epsilon_var, width=7)
+        epsilon_entry.pack(side=tk.LEFT)
+
+        tk.Label(analysis_type_frame, text="δ:", font=("Arial", 10)).pack(side=tk.LEFT, padx=(5, 0))
+        self.delta_var = tk.StringVar(value=str(DEFAULT_DELTA))
+        delta_entry = tk.Entry(analysis_type_frame, textvariable=self.delta_var, width=7)
+        delta_entry.pack(side=tk.LEFT)
+
         # Excel column frame - will be visible only for Excel files
         self.excel_frame = tk.Frame(self.root)
 
@@ -215,6 +334,12 @@ class TextAnalyzerApp:
         self.graph_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.graph_tab, text="Grafice")
 
+        # Tab for the per-column comparison
+        self.columns_tab = ttk.Frame(self.notebook)
+        self.notebook.add(self.columns_tab, text="Coloane")
+        self.column_summary = ColumnSummary(self.columns_tab)
+        self.column_summary.pack(fill=tk.BOTH, expand=True)
+
         # Middle frame for text content and statistics in text tab
         middle_frame = tk.Frame(self.text_tab)
         middle_frame.pack(fill=tk.BOTH, expand=True)
@@ -226,18 +351,19 @@ class TextAnalyzerApp:
         # Text area for file content
         self.content_text = scrolledtext.ScrolledText(content_frame, wrap=tk.WORD)
         self.content_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.preview = LazyPreview(self.content_text)
 
         # Frame for statistics
         stats_frame = tk.LabelFrame(middle_frame, text="Statistici", font=("Arial", 10, "bold"))
         stats_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=5)
 
-        # Text area for statistics
-        self.stats_text = scrolledtext.ScrolledText(stats_frame, wrap=tk.WORD)
-        self.stats_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        # Virtualized table for statistics - only the visible rows are rendered
+        self.stats_table = StatsTable(stats_frame)
+        self.stats_table.pack(fill=tk.BOTH, expand=True)
 
-        # Frame for charts in graph tab
-        self.chart_frame = tk.Frame(self.graph_tab)
-        self.chart_frame.pack(fill=tk.BOTH, expand=True)
+        # Charts in graph tab - one figure, updated in place
+        self.chart_view = ChartView(self.graph_tab)
+        self.chart_view.pack(fill=tk.BOTH, expand=True)
 
         # Status bar
         self.status_bar = tk.Label(self.root, text="Gata", bd=1, relief=tk.SUNKEN, anchor=tk.W)
@@ -250,6 +376,25 @@ class TextAnalyzerApp:
         self.total_items = 0
         self.file_type = ""
         self.df = None  # For storing pandas DataFrame for CSV/Excel files
+        self.streaming = False  # Fișierele .txt mari sunt analizate direct de pe disc
+        self.chart_data = None
+        self.loaded_column = None  # Coloana Excel încărcată în file_content
+        self.cached_only = False  # CSV neparsat, deoarece rezultatele sunt în cache-ul de pe disc
+        self.excel_columns = []  # Doar antetul; coloana aleasă se citește separat
+        self.column_data = None  # pandas.Series cu coloana Excel încărcată
+        self.approximate = None  # (epsilon, delta) folosit la ultima analiză
+        self.following = False  # Fișierul deschis este urmărit (doar octeții adăugați sunt citiți)
+        self.refreshing = False  # Afișarea curentă este o actualizare periodică (tabelul își păstrează starea)
+        self.follow_results = None
+        self.numeric_stats = None  # Statistici NumPy, doar pentru coloanele numerice
+
+        # Toate tipurile de analiză se calculează odată și se păstrează per fișier/coloană
+        self.analysis_cache = {}
+
+        # Analiza rulează pe un fir separat; rezultatele vin printr-o coadă verificată cu root.after
+        self.worker = None
+        self.worker_queue = queue.Queue()
+        self.cancel_event = threading.Event()
 
     def open_file(self):
         # Open file dialog
@@ -267,21 +412,37 @@ class TextAnalyzerApp:
             return
 
         self.file_path = file_path
+        self.streaming = False
+        self.loaded_column = None
+        self.cached_only = False
+        self.df = None
+        self.excel_columns = []
+        self.column_data = None
+        self.numeric_stats = None
         file_ext = os.path.splitext(file_path)[1].lower()
 
         try:
             if file_ext == '.txt':
                 self.file_type = "text"
-                with open(file_path, "r", encoding="utf-8") as file:
-                    self.file_content = file.read()
+                self.load_text(file_path)
                 # Hide Excel column selection frame
                 self.excel_frame.pack_forget()
 
             elif file_ext == '.csv':
                 self.file_type = "csv"
                 try:
-                    self.df = pd.read_csv(file_path)
-                    self.file_content = self.df.to_string()
+                    # CSV mare: la analiză este citit și numărat pe bucăți, chiar dacă rezultatele sunt în cache
+                    self.streaming = os.path.getsize(file_path) > STREAMING_THRESHOLD
+                    if self.in_disk_cache():
+                        # Fișier neschimbat, deja analizat: nu mai este nevoie să-l parsăm
+                        self.cached_only = True
+                    elif self.streaming:
+                        # Verificăm doar începutul fișierului
+                        load_pandas().read_csv(file_path, nrows=CSV_CHUNK_ROWS)
+                    else:
+                        self.df = load_pandas().read_csv(file_path)
+                    # Textul pentru analiză este generat abia pe firul de lucru, la analiză
+                    self.file_content = ""
                     # Hide Excel column selection frame
                     self.excel_frame.pack_forget()
                 except Exception as e:
@@ -289,8 +450,13 @@ class TextAnalyzerApp:
                     messagebox.showwarning("Eroare CSV",
                                            f"Nu s-a putut citi fișierul CSV corect. Încerc să-l deschid ca text: {str(e)}")
                     # Încercăm să-l deschidem ca un fișier text normal
-                    with open(file_path, "r", encoding="utf-8") as file:
-                        self.file_content = file.read()
+                    self.file_type = "text"
+                    self.df = None
+                    if self.streaming:
+                        self.file_content = ""
+                    else:
+                        with open(file_path, "r", encoding="utf-8") as file:
+                            self.file_content = file.read()
 
             elif file_ext in ['.xlsx', '.xls']:
                 self.file_type = "excel"
@@ -310,16 +476,17 @@ class TextAnalyzerApp:
                     return
 
                 try:
-                    self.df = pd.read_excel(file_path, engine=self.excel_engine)
+                    # Citim doar antetul; datele coloanei se citesc după ce este aleasă
+                    self.excel_columns = read_excel_columns(file_path, self.excel_engine_for(file_ext))
                     self.file_content = "Fișier Excel încărcat. Folosiți 'Încarcă Coloanele' pentru a selecta o coloană."
 
                     # Show Excel column selection frame
                     self.excel_frame.pack(pady=5, fill=tk.X, padx=10, before=self.file_label)
 
                     # Populate the column combobox
-                    self.excel_column_combo['values'] = list(self.df.columns)
-                    if len(self.df.columns) > 0:
-                        self.excel_column.set(self.df.columns[0])
+                    self.excel_column_combo['values'] = [str(column) for column in self.excel_columns]
+                    if len(self.excel_columns) > 0:
+                        self.excel_column.set(str(self.excel_columns[0]))
 
                 except Exception as e:
                     error_msg = str(e)
@@ -327,19 +494,41 @@ class TextAnalyzerApp:
                     self.status_bar.config(text=f"Eroare: {error_msg}")
                     return
 
-            # Update UI
+            # Update UI - previzualizarea încarcă doar prima pagină, restul la derulare
             self.file_label.config(text=f"Fișier: {os.path.basename(file_path)}")
-            self.content_text.delete(1.0, tk.END)
-            self.content_text.insert(tk.END, self.file_content)
+            if self.file_type == "excel":
+                self.preview.show_message(self.file_content)
+            elif self.file_type == "csv" and self.df is not None:
+                self.preview.show_frame(self.df)
+            else:
+                self.preview.show_file(file_path)
             self.analyze_button.config(state=tk.NORMAL)
+            self.columns_button.config(state=tk.NORMAL if self.has_tables() else tk.DISABLED)
+            self.follow_button.config(state=tk.NORMAL if self.file_type == "text" else tk.DISABLED)
             self.status_bar.config(text=f"Fișier încărcat: {os.path.basename(file_path)}")
 
         except Exception as e:
             messagebox.showerror("Eroare", f"Nu s-a putut deschide fișierul: {str(e)}")
             self.status_bar.config(text=f"Eroare: {str(e)}")
 
+    def load_text(self, file_path):
+        if os.path.getsize(file_path) > STREAMING_THRESHOLD:
+            # Fișier mare: nu îl încărcăm în memorie, îl analizăm în flux
+            self.streaming = True
+            self.file_content = ""
+        else:
+            self.streaming = False
+            with open(file_path, "r", encoding="utf-8") as file:
+                self.file_content = file.read()
+
+    def excel_engine_for(self, file_ext):
+        """Fișierele .xls vechi se citesc cu xlrd, dacă este instalat"""
+        if file_ext == '.xls' and module_available("xlrd"):
+            return 'xlrd'
+        return self.excel_engine
+
     def load_excel_columns(self):
-        if self.file_type != "excel" or self.df is None:
+        if self.file_type != "excel" or not self.excel_columns:
             self.status_bar.config(text="Niciun fișier Excel încărcat")
             return
 
@@ -349,358 +538,582 @@ class TextAnalyzerApp:
             return
 
         try:
-            column_data = self.df[selected_column].to_string()
-            self.content_text.delete(1.0, tk.END)
-            self.content_text.insert(tk.END, column_data)
-            self.file_content = column_data
+            # Se citesc doar celulele coloanei alese
+            file_ext = os.path.splitext(self.file_path)[1].lower()
+            self.column_data = read_excel_column(self.file_path, selected_column, self.excel_engine_for(file_ext))
+            self.numeric_stats = numeric_stats(self.column_data)
+            self.preview.show_frame(self.column_data)
+            self.file_content = ""
+            self.loaded_column = selected_column
             self.status_bar.config(text=f"Coloana '{selected_column}' încărcată")
         except Exception as e:
             messagebox.showerror("Eroare", f"Nu s-a putut încărca coloana: {str(e)}")
             self.status_bar.config(text=f"Eroare: {str(e)}")
 
+    def has_content(self):
+        return (bool(self.file_content) or self.streaming or self.cached_only
+                or (self.file_type == "csv" and self.df is not None) or self.column_data is not None)
+
+    def disk_cache_keys(self, content_hash, modes=ANALYSIS_MODES):
+        """Cheile din cache-ul de pe disc pentru tipurile de analiză date ale conținutului curent"""
+        return {
+            mode: self.disk_cache.make_key(content_hash, mode, self.file_type, self.loaded_column,
+                                           self.connecting_words)
+            for mode in modes
+        }
+
+    def in_disk_cache(self):
+        """Rulează pe firul Tk: folosește doar un hash deja calculat, deci nu citește fișierul"""
+        if self.disk_cache is None:
+            return False
+        try:
+            content_hash = self.disk_cache.known_hash(self.file_path)
+            if content_hash is None:
+                return False
+            keys = self.disk_cache_keys(content_hash)
+            return all(self.disk_cache.contains(key) for key in keys.values())
+        except Exception:
+            return False
+
+    def invalidate_cache(self):
+        """Șterge rezultatele fișierului curent (sau tot cache-ul, dacă nu e deschis niciun fișier)"""
+        self.analysis_cache.clear()
+        if self.disk_cache is None:
+            self.status_bar.config(text="Cache golit")
+            return
+        try:
+            if self.file_path:
+                self.disk_cache.invalidate(self.disk_cache.content_hash(self.file_path))
+                self.status_bar.config(text=f"Cache invalidat pentru {os.path.basename(self.file_path)}")
+            else:
+                self.disk_cache.invalidate()
+                self.status_bar.config(text="Cache golit")
+        except Exception as e:
+            self.status_bar.config(text=f"Eroare la golirea cache-ului: {str(e)}")
+
     def analyze_content(self):
-        if not self.file_content:
+        if not self.has_content():
             self.status_bar.config(text="Niciun conținut de analizat")
             return
 
-        # Clear previous stats
-        self.stats_text.delete(1.0, tk.END)
+        if self.worker is not None:
+            return
+
+        try:
+            self.approximate = self.approximate_setting()
+        except ValueError:
+            messagebox.showerror("Eroare", "ε și δ trebuie să fie numere între 0 și 1 (de exemplu 0.0001 și 0.001)")
+            return
+
+        analysis_type = self.selected_mode()
+        key = self.analysis_key()
 
-        # Process the text based on analysis type
+        # Conținutul a mai fost analizat: schimbarea tipului de analiză e instantanee
+        if analysis_type in self.analysis_cache.get(key, {}):
+            self.show_cached(self.analysis_cache[key], analysis_type)
+            return
+
+        # Process the text on a worker thread - all analysis types in one pass (n-grams separately)
         self.status_bar.config(text="Analizez conținutul...")
+        self.start_worker(self.run_analysis, analysis_type, key)
+
+    def start_worker(self, target, *args):
+        """Pornește target(*args, coadă, anulare) pe un fir separat și verifică periodic coada"""
+        self.cancel_event = threading.Event()
+        self.worker_queue = queue.Queue()
+        self.worker = threading.Thread(
+            target=target,
+            args=(*args, self.worker_queue, self.cancel_event),
+            daemon=True
+        )
+        self.set_busy(True)
+        self.worker.start()
+        self.root.after(100, self.poll_worker)
+
+    def has_tables(self):
+        return self.file_type in ("csv", "excel") and bool(self.file_path)
 
+    def analyze_all_columns(self):
+        if not self.has_tables() or self.worker is not None:
+            return
+        analysis_type = self.selected_mode()
+        self.status_bar.config(text="Analizez toate coloanele...")
+        self.start_worker(self.run_column_analysis, analysis_type)
+
+    def column_tables(self):
+        """Rulează pe firul de lucru; întoarce (perechi (tabel, DataFrame), numărul de coloane sau None)"""
+        pd = load_pandas()
+        name = os.path.basename(self.file_path)
+        if self.file_type == "excel":
+            file_ext = os.path.splitext(self.file_path)[1].lower()
+            sheets = read_excel_sheets(self.file_path, self.excel_engine_for(file_ext))
+            return list(sheets.items()), sum(frame.shape[1] for frame in sheets.values())
+        if self.df is not None:
+            return [(name, self.df)], self.df.shape[1]
+        # CSV mare sau neparsat: coloanele sunt numărate bucată cu bucată
+        chunks = pd.read_csv(self.file_path, chunksize=CSV_CHUNK_ROWS)
+        return ((name, chunk) for chunk in chunks), None
+
+    def run_column_analysis(self, analysis_type, results, cancel):
+        """Rulează pe firul de lucru: fiecare coloană este numărată separat, pe procese"""
+        def progress(fraction):
+            results.put(("progress", fraction))
+
+        try:
+            tables, expected = self.column_tables()
+            counted = count_columns(tables, analysis_type, self.connecting_words, expected=expected,
+                                    progress=progress, cancel=cancel)
+            results.put(("columns", (analysis_type, profile_columns(counted))))
+        except AnalysisCancelled:
+            results.put(("cancelled", None))
+        except Exception as e:
+            results.put(("error", str(e)))
+
+    def selected_mode(self):
+        """Tipul de analiză ales; pentru n-grame include și n (de exemplu "2-grams")"""
         analysis_type = self.analysis_type.get()
+        if analysis_type == NGRAM_KIND:
+            return ngram_mode(int(self.ngram_var.get()))
+        return analysis_type
+
+    def approximate_setting(self):
+        """(epsilon, delta) pentru numărarea aproximativă sau None; ValueError pentru un ε sau δ invalid"""
+        if not self.approximate_var.get():
+            return None
+        epsilon = float(self.epsilon_var.get())
+        delta = float(self.delta_var.get())
+        if not (0 < epsilon < 1 and 0 < delta < 1):
+            raise ValueError((epsilon, delta))
+        return epsilon, delta
+
+    def content_approximate(self):
+        # Tabelele (CSV/Excel) sunt numărate mereu exact
+        return self.approximate if self.file_type == "text" else None
+
+    def analysis_key(self):
+        """Cheia din cache: fișierul (cu mărime și dată), coloana Excel, cuvintele de legătură și aproximarea"""
+        try:
+            stat = os.stat(self.file_path)
+            version = (stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            version = None
+        return (self.file_path, version, self.file_type, self.loaded_column, frozenset(self.connecting_words),
+                self.content_approximate())
+
+    def run_analysis(self, analysis_type, key, results, cancel):
+        """Rulează pe firul de lucru: nu atinge widget-urile, comunică doar prin coadă"""
+        def progress(fraction):
+            results.put(("progress", fraction))
+
+        last_partial = 0.0
+
+        def partial(counted):
+            # Primele elemente din rezultatul parțial, cel mult o dată la PARTIAL_INTERVAL secunde
+            nonlocal last_partial
+            now = time.monotonic()
+            if now - last_partial < PARTIAL_INTERVAL:
+                return
+            last_partial = now
+            if mode == MULTI_MODE:
+                counted = counted[analysis_type]
+            counts, total_items, _ = counted
+            results.put(("partial", (analysis_type, top_items(counts, PARTIAL_TOP), total_items)))
+
+        # Tipurile de bază sunt numărate împreună; n-gramele (care depind de n) separat
+        modes = ANALYSIS_MODES if analysis_type in ANALYSIS_MODES else (analysis_type,)
+        mode = MULTI_MODE if len(modes) > 1 else analysis_type
+
+        try:
+            analyzed = self.load_from_disk_cache(modes)
+            if analyzed is None:
+                counted = self.count_content(mode, progress, cancel, partial, self.content_approximate())
+                if mode != MULTI_MODE:
+                    counted = {mode: counted}
+                # Contoarele sunt înlocuite cu stocarea compactă (NumPy); elementele se decodează la afișare
+                analyzed = {
+                    mode: (CompactRanked.from_counter(counts), total_items, total_tokens)
+                    for mode, (counts, total_items, total_tokens) in counted.items()
+                }
+                del counted
+                self.store_in_disk_cache(analyzed)
+            sorted_items, total_items, _ = analyzed[analysis_type]
+            chart_data = prepare_chart_data(sorted_items, total_items, analysis_type) if sorted_items else None
+            results.put(("done", (key, analyzed, analysis_type, chart_data)))
+        except AnalysisCancelled:
+            results.put(("cancelled", None))
+        except Exception as e:
+            results.put(("error", str(e)))
+
+    def load_from_disk_cache(self, modes=ANALYSIS_MODES):
+        """Rulează pe firul de lucru; întoarce rezultatele tipurilor de analiză date sau None"""
+        if self.disk_cache is None or not self.file_path or self.content_approximate():
+            return None
+        if self.file_type == "excel" and self.loaded_column is None:
+            return None
+        try:
+            keys = self.disk_cache_keys(self.disk_cache.content_hash(self.file_path), modes)
+            analyzed = {}
+            for mode, key in keys.items():
+                entry = self.disk_cache.load(key)
+                if entry is None:
+                    return None
+                counts, total_items, total_tokens = entry
+                analyzed[mode] = (CompactRanked(counts), total_items, total_tokens)
+            return analyzed
+        except Exception:
+            return None
+
+    def store_in_disk_cache(self, analyzed):
+        if self.disk_cache is None or not self.file_path or self.content_approximate():
+            return
+        if self.file_type == "excel" and self.loaded_column is None:
+            return
+        try:
+            content_hash = self.disk_cache.content_hash(self.file_path)
+            keys = self.disk_cache_keys(content_hash, analyzed)
+            for mode, (sorted_items, total_items, total_tokens) in analyzed.items():
+                self.disk_cache.store(keys[mode], content_hash, sorted_items.store, total_items, total_tokens)
+        except Exception:
+            pass  # Cache-ul este doar o optimizare; analiza continuă fără el
+
+    def poll_worker(self):
+        """Preia mesajele de la firul de lucru și actualizează interfața"""
+        try:
+            while True:
+                kind, payload = self.worker_queue.get_nowait()
+                if kind == "progress":
+                    self.status_bar.config(text=f"Analizez conținutul... {payload * 100:.0f}%")
+                    continue
+                if kind == "partial":
+                    self.show_partial(*payload)
+                    continue
+                if kind == "follow":
+                    self.show_follow(payload)
+                    continue
+
+                self.worker = None
+                self.set_busy(False)
+                if kind == "done":
+                    key, analyzed, analysis_type, chart_data = payload
+                    self.store_cached(key, analyzed)
+                    self.show_results(analysis_type, *analyzed[analysis_type], chart_data)
+                elif kind == "columns":
+                    analysis_type, profiles = payload
+                    self.column_summary.set_data(profiles, item_type(analysis_type))
+                    self.notebook.select(self.columns_tab)
+                    self.status_bar.config(text=f"Analiză completă pentru {len(profiles)} coloane")
+                elif kind == "stopped":
+                    # Conținutul din memorie și previzualizarea includ acum și liniile adăugate
+                    self.load_text(self.file_path)
+                    self.preview.show_file(self.file_path)
+                    self.status_bar.config(text="Urmărire oprită")
+                elif kind == "cancelled":
+                    # Nu lăsăm în tabel rezultate parțiale; rezultatele anterioare dispar odată cu ele,
+                    # ca graficele să nu mai poată desena altceva decât arată tabelul
+                    self.stats_table.clear()
+                    self.chart_view.clear()
+                    self.sorted_items = []
+                    self.total_items = 0
+                    self.chart_data = None
+                    self.graph_button.config(state=tk.DISABLED)
+                    self.status_bar.config(text="Analiză anulată")
+                else:
+                    messagebox.showerror("Eroare", f"Analiza a eșuat: {payload}")
+                    self.status_bar.config(text=f"Eroare: {payload}")
+                return
+        except queue.Empty:
+            pass
+
+        self.root.after(100, self.poll_worker)
+
+    def toggle_follow(self):
+        if self.following:
+            self.cancel_analysis()
+            return
+        if self.file_type != "text" or not self.file_path or self.worker is not None:
+            return
+        try:
+            self.approximate = self.approximate_setting()
+        except ValueError:
+            messagebox.showerror("Eroare", "ε și δ trebuie să fie numere între 0 și 1 (de exemplu 0.0001 și 0.001)")
+            return
+        self.following = True
+        self.status_bar.config(text=f"Urmăresc {os.path.basename(self.file_path)}...")
+        analysis_type = self.selected_mode()
+        self.start_worker(self.run_follow, MULTI_MODE if analysis_type in ANALYSIS_MODES else analysis_type,
+                          self.approximate)
+
+    def run_follow(self, mode, approximate, results, cancel):
+        """Rulează pe firul de lucru: citește doar octeții noi și trimite rezultatele cel mult o dată pe secundă"""
+        follower = FileFollower(self.file_path, mode, frozenset(self.connecting_words), approximate)
+        last_refresh = 0.0
+        changed = False
+        try:
+            while not cancel.is_set():
+                read = follower.read_new()
+                changed = changed or read > 0
+                now = time.monotonic()
+                if changed and now - last_refresh >= FOLLOW_REFRESH:
+                    # Copie compactă: interfața nu vede contoarele pe care firul le modifică în continuare
+                    counted = follower.result()
+                    if mode != MULTI_MODE:
+                        counted = {mode: counted}
+                    analyzed = {
+                        counted_mode: (CompactRanked.from_counter(counts), total_items, total_tokens)
+                        for counted_mode, (counts, total_items, total_tokens) in counted.items()
+                    }
+                    results.put(("follow", (analyzed, follower.offset)))
+                    last_refresh = now
+                    changed = False
+                if not read:
+                    cancel.wait(FOLLOW_POLL)
+            results.put(("stopped", None))
+        except Exception as e:
+            results.put(("error", str(e)))
+
+    def show_follow(self, payload):
+        analyzed, offset = payload
+        self.follow_results = analyzed
+        # Tipul de analiză poate fi schimbat în timpul urmăririi; afișăm doar ce se numără
+        analysis_type = self.selected_mode()
+        if analysis_type in analyzed:
+            # Actualizarea nu mută tabelul: ordinea, poziția și selecția utilizatorului rămân
+            self.refreshing = True
+            try:
+                self.show_cached(analyzed, analysis_type)
+            finally:
+                self.refreshing = False
+            self.graph_button.config(state=tk.NORMAL)
+
+        # Graficele deja afișate sunt actualizate odată cu tabelul
+        if self.chart_view.has_chart():
+            self.generate_graphs(select_tab=False)
+        self.status_bar.config(text=f"Urmăresc {os.path.basename(self.file_path)}: {offset} octeți citiți")
+
+    def cancel_analysis(self):
+        if self.worker is not None:
+            self.cancel_event.set()
+            self.status_bar.config(text="Se anulează analiza...")
+
+    def set_busy(self, busy):
+        """Blochează butoanele cât timp rulează o analiză"""
+        state = tk.DISABLED if busy else tk.NORMAL
+        self.open_button.config(state=state)
+        self.analyze_button.config(state=state)
+        self.clear_button.config(state=state)
+        self.invalidate_button.config(state=state)
+        self.load_columns_button.config(state=state)
+        self.columns_button.config(state=tk.NORMAL if not busy and self.has_tables() else tk.DISABLED)
+        self.cancel_button.config(state=tk.NORMAL if busy else tk.DISABLED)
+        if not busy:
+            self.following = False
+        self.follow_button.config(
+            state=tk.NORMAL if self.following or (not busy and self.file_type == "text") else tk.DISABLED)
+        if busy:
+            self.graph_button.config(state=tk.DISABLED)
+        elif self.sorted_items:
+            self.graph_button.config(state=tk.NORMAL)
+
+    def store_cached(self, key, analyzed):
+        # N-gramele se adaugă la rezultatele deja numărate pentru același conținut
+        analyzed = {**self.analysis_cache.pop(key, {}), **analyzed}
+        if len(self.analysis_cache) >= ANALYSIS_CACHE_SIZE:
+            # Eliminăm cel mai vechi rezultat
+            self.analysis_cache.pop(next(iter(self.analysis_cache)))
+        self.analysis_cache[key] = analyzed
+
+    def show_cached(self, analyzed, analysis_type):
+        sorted_items, total_items, total_tokens = analyzed[analysis_type]
+        chart_data = prepare_chart_data(sorted_items, total_items, analysis_type) if sorted_items else None
+        self.show_results(analysis_type, sorted_items, total_items, total_tokens, chart_data)
+
+    def show_results(self, analysis_type, sorted_items, total_items, total_tokens, chart_data):
+        """Rezultatele sunt aplicate doar la final, deci o analiză anulată nu lasă date parțiale"""
+        self.sorted_items = sorted_items
+        self.total_items = total_items
+        self.chart_data = chart_data
 
         if analysis_type == "words":
-            self.analyze_words()
+            self.show_word_stats(total_tokens)
         elif analysis_type == "numbers":
-            self.analyze_numbers()
+            self.show_number_stats()
         elif analysis_type == "letters":
-            self.analyze_letters()
+            self.show_letter_stats()
         elif analysis_type == "all":
-            self.analyze_all()
+            self.show_all_stats()
+        elif analysis_kind(analysis_type) == NGRAM_KIND:
+            self.show_ngram_stats(analysis_type, total_tokens)
 
         # Enable graph button
         self.graph_button.config(state=tk.NORMAL)
 
-    def analyze_words(self):
-        # Remove punctuation and convert to lowercase
-        translator = str.maketrans('', '', string.punctuation)
-        clean_text = self.file_content.translate(translator).lower()
-
-        # Split into words
-        words = clean_text.split()
-
-        # Count words excluding connecting words
-        word_count = {}
-        self.total_items = 0
-
-        for word in words:
-            if word not in self.connecting_words and len(word) > 1:  # Exclude single letters too
-                self.total_items += 1
-                if word in word_count:
-                    word_count[word] += 1
-                else:
-                    word_count[word] = 1
-
-        # Sort by frequency (descending)
-        self.sorted_items = sorted(word_count.items(), key=lambda x: x[1], reverse=True)
-
+    def count_content(self, mode, progress=None, cancel=None, partial=None, approximate=None):
+        """Numără elementele din conținutul încărcat sau, pentru fișierele mari, direct din fișier"""
+        if self.streaming and self.file_type == "csv":
+            pd = load_pandas()
+            try:
+                return count_csv(self.file_path, mode, self.connecting_words,
+                                 progress=progress, partial=partial, cancel=cancel)
+            except (pd.errors.ParserError, pd.errors.EmptyDataError, UnicodeDecodeError):
+                # Ca la deschidere: un CSV care nu poate fi parsat este numărat ca text
+                return count_file(self.file_path, mode, self.connecting_words, progress, cancel)
+        if self.streaming:
+            return count_file(self.file_path, mode, self.connecting_words, progress, cancel, approximate)
+        # Tabelele sunt numărate direct din valori (fără index și antet), vectorizat
+        if self.file_type == "excel" and self.column_data is not None:
+            return count_frame(self.column_data, mode, self.connecting_words, progress, cancel)
+        if self.file_type == "csv":
+            frame = self.df
+            if frame is None:
+                # CSV mic neparsat la deschidere (era în cache): citit doar pentru această analiză,
+                # fără a modifica starea interfeței de pe firul de lucru
+                frame = load_pandas().read_csv(self.file_path)
+            return count_frame(frame, mode, self.connecting_words, progress, cancel)
+        return count_string(self.file_content, mode, self.connecting_words, progress, cancel,
+                            approximate=approximate)
+
+    def show_partial(self, analysis_type, top, total_items):
+        """Afișează primele elemente cât timp analiza continuă (fișierele CSV mari)"""
+        summary = f"Rezultate parțiale - {item_type(analysis_type)}: {total_items} până acum"
+        self.stats_table.set_data(RankedItems.from_ranked(top), total_items, summary,
+                                  *STATS_HEADINGS[analysis_kind(analysis_type)])
+
+    def approximation_note(self):
+        """Eroarea garantată a rezultatelor aproximative (gol pentru numărarea exactă)"""
+        max_error = getattr(self.sorted_items, "max_error", None)
+        if max_error is None:
+            return ""
+        epsilon, delta = self.approximate
+        return (f"\nAproximativ (ε={epsilon:g}, δ={delta:g}): {len(self.sorted_items)} elemente frecvente, "
+                f"fiecare frecvență supraestimată cu cel mult {max_error} "
+                f"(garantat: cel mult {self.sorted_items.error_bound})")
+
+    def show_word_stats(self, total_words):
         # Display the statistics
-        self.stats_text.insert(tk.END, f"Total Cuvinte: {len(words)}\n")
-        self.stats_text.insert(tk.END, f"Cuvinte Semnificative: {self.total_items}\n\n")
-        self.stats_text.insert(tk.END, "Statistici Frecvență Cuvinte:\n")
-        self.stats_text.insert(tk.END, "-" * 40 + "\n")
-        self.stats_text.insert(tk.END, "Cuvânt\t\tNumăr\t\tProcentaj\n")
-        self.stats_text.insert(tk.END, "-" * 40 + "\n")
-
-        for word, count in self.sorted_items:
-            percentage = (count / self.total_items) * 100
-            self.stats_text.insert(tk.END, f"{word}\t\t{count}\t\t{percentage:.2f}%\n")
+        summary = f"Total Cuvinte: {total_words}\nCuvinte Semnificative: {self.total_items}"
+        summary += self.approximation_note()
+        self.stats_table.set_data(self.sorted_items, self.total_items, summary, *STATS_HEADINGS["words"],
+                                  keep_view=self.refreshing)
 
         self.status_bar.config(text="Analiză cuvinte completă")
 
-    def analyze_numbers(self):
-        # Extract numbers from text
-        numbers = re.findall(r'\b\d+(?:\.\d+)?\b', self.file_content)
-
-        # Count number occurrences
-        number_count = {}
-        self.total_items = len(numbers)
-
-        for number in numbers:
-            if number in number_count:
-                number_count[number] += 1
-            else:
-                number_count[number] = 1
-
-        # Sort by frequency
-        self.sorted_items = sorted(number_count.items(), key=lambda x: x[1], reverse=True)
-
+    def show_number_stats(self):
         # Display statistics
-        self.stats_text.insert(tk.END, f"Total Numere: {self.total_items}\n\n")
-        self.stats_text.insert(tk.END, "Statistici Frecvență Numere:\n")
-        self.stats_text.insert(tk.END, "-" * 40 + "\n")
-        self.stats_text.insert(tk.END, "Număr\t\tApariții\t\tProcentaj\n")
-        self.stats_text.insert(tk.END, "-" * 40 + "\n")
-
-        for number, count in self.sorted_items:
-            percentage = (count / self.total_items) * 100
-            self.stats_text.insert(tk.END, f"{number}\t\t{count}\t\t{percentage:.2f}%\n")
+        summary = f"Total Numere: {self.total_items}" + self.approximation_note()
+        stats = self.numeric_stats
+        if stats is not None:
+            quantiles = stats["quantiles"]
+            summary += (f"\nMedie: {stats['mean']:.6g}   Abatere standard: {stats['std']:.6g}"
+                        f"\nMin: {stats['min']:.6g}   Max: {stats['max']:.6g}"
+                        f"\nQ1: {quantiles[0.25]:.6g}   Mediană: {quantiles[0.5]:.6g}   Q3: {quantiles[0.75]:.6g}"
+                        f"\nP5: {quantiles[0.05]:.6g}   P95: {quantiles[0.95]:.6g}")
+        self.stats_table.set_data(self.sorted_items, self.total_items, summary, *STATS_HEADINGS["numbers"],
+                                  keep_view=self.refreshing)
 
         self.status_bar.config(text="Analiză numere completă")
 
-    def analyze_letters(self):
-        # Extract only letters from text and convert to lowercase
-        letters = re.findall(r'[a-zA-Z]', self.file_content.lower())
-
-        # Count letter occurrences
-        letter_count = {}
-        self.total_items = len(letters)
-
-        for letter in letters:
-            if letter in letter_count:
-                letter_count[letter] += 1
-            else:
-                letter_count[letter] = 1
-
-        # Sort by frequency
-        self.sorted_items = sorted(letter_count.items(), key=lambda x: x[1], reverse=True)
-
+    def show_letter_stats(self):
         # Display statistics
-        self.stats_text.insert(tk.END, f"Total Litere: {self.total_items}\n\n")
-        self.stats_text.insert(tk.END, "Statistici Frecvență Litere:\n")
-        self.stats_text.insert(tk.END, "-" * 40 + "\n")
-        self.stats_text.insert(tk.END, "Literă\t\tApariții\t\tProcentaj\n")
-        self.stats_text.insert(tk.END, "-" * 40 + "\n")
-
-        for letter, count in self.sorted_items:
-            percentage = (count / self.total_items) * 100
-            self.stats_text.insert(tk.END, f"{letter}\t\t{count}\t\t{percentage:.2f}%\n")
+        summary = f"Total Litere: {self.total_items}"
+        self.stats_table.set_data(self.sorted_items, self.total_items, summary, *STATS_HEADINGS["letters"],
+                                  keep_view=self.refreshing)
 
         self.status_bar.config(text="Analiză litere completă")
 
-    def analyze_all(self):
-        # Extract all characters from text
-        chars = [c for c in self.file_content.lower() if c.isalnum()]
-
-        # Count character occurrences
-        char_count = {}
-        self.total_items = len(chars)
-
-        for char in chars:
-            if char in char_count:
-                char_count[char] += 1
-            else:
-                char_count[char] = 1
-
-        # Sort by frequency
-        self.sorted_items = sorted(char_count.items(), key=lambda x: x[1], reverse=True)
-
+    def show_all_stats(self):
         # Display statistics
-        self.stats_text.insert(tk.END, f"Total Caractere: {self.total_items}\n\n")
-        self.stats_text.insert(tk.END, "Statistici Frecvență Caractere:\n")
-        self.stats_text.insert(tk.END, "-" * 40 + "\n")
-        self.stats_text.insert(tk.END, "Caracter\t\tApariții\t\tProcentaj\n")
-        self.stats_text.insert(tk.END, "-" * 40 + "\n")
-
-        for char, count in self.sorted_items:
-            percentage = (count / self.total_items) * 100
-            self.stats_text.insert(tk.END, f"{char}\t\t{count}\t\t{percentage:.2f}%\n")
+        summary = f"Total Caractere: {self.total_items}"
+        self.stats_table.set_data(self.sorted_items, self.total_items, summary, *STATS_HEADINGS["all"],
+                                  keep_view=self.refreshing)
 
         self.status_bar.config(text="Analiză completă a tuturor caracterelor")
 
-    def generate_graphs(self):
-        if not self.sorted_items:
+    def show_ngram_stats(self, analysis_type, total_words):
+        # Display statistics
+        summary = (f"Total Cuvinte: {total_words}\nTotal {item_type(analysis_type)}: {self.total_items}"
+                   f"\n{item_type(analysis_type)} distincte: {len(self.sorted_items)}")
+        self.stats_table.set_data(self.sorted_items, self.total_items, summary, *STATS_HEADINGS[NGRAM_KIND],
+                                  keep_view=self.refreshing)
+
+        self.status_bar.config(text=f"Analiză {item_type(analysis_type).lower()} completă")
+
+    def generate_graphs(self, select_tab=True):
+        # Dacă s-a schimbat între timp tipul de analiză, rezultatul este deja în cache
+        analysis_type = self.selected_mode()
+        cached = self.follow_results if self.following else self.analysis_cache.get(self.analysis_key())
+        if (cached is not None and analysis_type in cached and self.chart_data is not None
+                and self.chart_data["analysis_type"] != analysis_type):
+            self.show_cached(cached, analysis_type)
+
+        if not self.sorted_items or self.chart_data is None:
             self.status_bar.config(text="Nu există date pentru generarea graficelor")
             return
 
-        # Clear previous graphs
-        for widget in self.chart_frame.winfo_children():
-            widget.destroy()
-
-        # Create a figure for both charts
-        fig = plt.figure(figsize=(10, 8))
-
-        # Get the type of item being analyzed
-        analysis_type = self.analysis_type.get()
-        if analysis_type == "words":
-            item_type = "Cuvinte"
-        elif analysis_type == "numbers":
-            item_type = "Numere"
-        elif analysis_type == "letters":
-            item_type = "Litere"
-        else:
-            item_type = "Caractere"
-
-        # Limit to top items for clarity (more for letters since there are fewer)
-        top_limit = 10 if analysis_type != "letters" else 20
-        top_items = self.sorted_items[:min(top_limit, len(self.sorted_items))]
-
-        # Create pie chart
-        ax1 = fig.add_subplot(211)
-
-        # FIX pentru etichetele suprapuse
-        labels = [item for item, _ in top_items]
-        sizes = [count for _, count in top_items]
-
-        # Adăugăm procente la etichete pentru identificare ușoară
-        total = sum(sizes)
-        labels_with_pct = [f"{labels[i]} ({sizes[i] / total * 100:.1f}%)" for i in range(len(labels))]
-
-        # Create color map
-        colors = plt.cm.Blues([(i + 1) / (len(labels) + 1) for i in range(len(labels))])
-
-        # Prag minim pentru a grupa valorile foarte mici
-        prag_minim = 0.02  # 2%
-
-        # Grupăm valorile foarte mici într-o singură felie "Altele"
-        sizes_noi = []
-        labels_noi = []
-        colors_noi = []
-        suma_mici = 0
-
-        for i, size in enumerate(sizes):
-            if size / total >= prag_minim:
-                sizes_noi.append(size)
-                labels_noi.append(labels[i])
-                colors_noi.append(colors[i])
-            else:
-                suma_mici += size
-
-        # Adăugăm categoria "Altele" dacă există valori mici
-        if suma_mici > 0:
-            sizes_noi.append(suma_mici)
-            labels_noi.append("Altele")
-            colors_noi.append("gray")  # Culoare pentru "Altele"
-
-        # Creăm graficul pie cu valorile ajustate
-        wedges, texts = ax1.pie(
-            sizes_noi,
-            labels=None,  # Eliminăm etichetele directe
-            startangle=90,
-            colors=colors_noi,
-            wedgeprops={'edgecolor': 'w', 'linewidth': 1},
-            explode=[0.05] * len(sizes_noi)  # Dispersare ușoară
-        )
-
-        # Adăugăm o legendă în afara graficului
-        ax1.legend(
-            wedges,
-            labels_with_pct,
-            title=f"Top {min(top_limit, len(self.sorted_items))} {item_type}",
-            loc="center left",
-            bbox_to_anchor=(1, 0.5)  # Poziționăm legenda în dreapta graficului
-        )
-
-        # Ajustăm layout-ul pentru a face loc legendei și titlului
-        plt.tight_layout()
-        plt.subplots_adjust(top=0.9, right=0.75)  # Spațiu pentru titlu și legendă
-
-        # Adăugăm procentele pentru fiecare felie, chiar și pentru cele foarte mici
-        text_positions = []  # Listă pentru a stoca pozițiile textelor
-
-        for i, wedge in enumerate(wedges):
-            angle = (wedge.theta2 - wedge.theta1) / 2. + wedge.theta1  # Unghiul de mijloc al feliei
-            x = 1.3 * np.cos(np.deg2rad(angle))  # Coordonata x în afara graficului
-            y = 1.3 * np.sin(np.deg2rad(angle))  # Coordonata y în afara graficului
-
-            # Verificăm dacă textul se suprapune cu alte texte
-            overlap = False
-            for pos in text_positions:
-                if np.sqrt((x - pos[0]) ** 2 + (y - pos[1]) ** 2) < 0.2:  # Distanță minimă între texte
-                    overlap = True
-                    break
-
-            if overlap:
-                # Dacă se suprapune, ajustăm poziția
-                x = 1.5 * np.cos(np.deg2rad(angle))  # Mărim distanța
-                y = 1.5 * np.sin(np.deg2rad(angle))
-
-            # Adăugăm textul procentului
-            ax1.annotate(
-                f"{sizes[i] / total * 100:.1f}%",
-                xy=(np.cos(np.deg2rad(angle)), np.sin(np.deg2rad(angle))),  # Punctul de conectare pe felie
-                xytext=(x, y),  # Poziția textului în afara graficului
-                arrowprops=dict(
-                    arrowstyle="->",
-                    connectionstyle="arc3,rad=0.1",
-                    color=colors[i]  # Săgeata are culoarea feliei respective
-                ),
-                ha='center',  # Aliniere orizontală
-                va='center'  # Aliniere verticală
-            )
-
-            # Adăugăm poziția textului în listă
-            text_positions.append((x, y))
-
-        ax1.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle
-        ax1.set_title(f'Top {min(top_limit, len(self.sorted_items))} {item_type} - Distribuție',
-                      y=1.25)  # Mutăm titlul mai sus
-
-        # Create bar chart
-        ax2 = fig.add_subplot(212)
-
-        # Limitarea numărului de bare pentru claritate
-        display_limit = min(10, len(top_items))
-        items = [item for item, _ in top_items[:display_limit]]
-        frequencies = [count / self.total_items for _, count in top_items[:display_limit]]
-
-        # Create bar chart
-        bars = ax2.bar(items, frequencies, color=plt.cm.Blues(0.6))
-
-        # Add values on top of each bar
-        for bar in bars:
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width() / 2., height,
-                     f'{height:.2f}', ha='center', va='bottom')
-
-        ax2.set_title(f'Frecvențe {item_type}')
-        ax2.set_xlabel(f'{item_type}')
-        ax2.set_ylabel('Frecvență')
-
-        # Rotate x-axis labels for better readability if needed
-        plt.xticks(rotation=45, ha='right')
-
-        # Adjust layout - mai multă atenție la spațiul pentru legendă
-        plt.tight_layout()
-        plt.subplots_adjust(right=0.75)  # Spațiu pentru legendă
-
-        # Embed the graphs in the Tkinter window
-        canvas = FigureCanvasTkAgg(fig, master=self.chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        # Datele au fost pregătite pe firul de lucru, odată cu analiza; figura existentă este refolosită.
+        # Pentru o coloană numerică, histograma valorilor înlocuiește diagrama pie
+        self.chart_view.show(self.chart_data, self.numeric_stats, self.loaded_column)
 
         # Switch to the graph tab
-        self.notebook.select(self.graph_tab)
+        if select_tab:
+            self.notebook.select(self.graph_tab)
 
         self.status_bar.config(text="Grafice generate")
+
     def clear_all(self):
-        self.content_text.delete(1.0, tk.END)
-        self.stats_text.delete(1.0, tk.END)
+        self.preview.reset()
+        self.stats_table.clear()
         self.file_label.config(text="Niciun fișier selectat")
         self.file_content = ""
         self.file_path = ""
         self.sorted_items = []
         self.total_items = 0
+        self.chart_data = None
+        self.loaded_column = None
+        self.cached_only = False
         self.analyze_button.config(state=tk.DISABLED)
         self.graph_button.config(state=tk.DISABLED)
+        self.columns_button.config(state=tk.DISABLED)
+        self.follow_button.config(state=tk.DISABLED)
+        self.follow_results = None
+        self.column_summary.clear()
         self.file_type = ""
         self.df = None
+        self.excel_columns = []
+        self.column_data = None
+        self.numeric_stats = None
+        self.streaming = False
 
         # Hide Excel column selection frame
         self.excel_frame.pack_forget()
 
         # Clear graphs
-        for widget in self.chart_frame.winfo_children():
-            widget.destroy()
+        self.chart_view.clear()
 
         self.status_bar.config(text="Gata")
 
 
+def measure_startup():
+    """Afișează timpul până la apariția ferestrei și ce module grele au fost deja încărcate"""
+    try:
+        root = tk.Tk()
+        TextAnalyzerApp(root)
+        root.update()
+        stage = "fereastră afișată"
+        root.destroy()
+    except tk.TclError:
+        stage = "fără ecran, doar importuri"
+
+    elapsed = (time.perf_counter() - STARTUP_BEGIN) * 1000
+    heavy = ", ".join(loaded_heavy_modules()) or "niciunul"
+    print(f"Pornire ({stage}): {elapsed:.0f} ms; module grele încărcate: {heavy}")
+
+
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = TextAnalyzerApp(root)
-    root.mainloop()
+    if "--startup-time" in sys.argv:
+        measure_startup()
+    else:
+        root = tk.Tk()
+        app = TextAnalyzerApp(root)
+        root.mainloop()
 
 
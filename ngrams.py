@@ -0,0 +1,225 @@
+"""Frecvențele n-gramelor de cuvinte (bigrame, trigrame...), după eliminarea cuvintelor de legătură.
+
+Fiecare cuvânt primește la prima apariție un identificator întreg (vocabular
+internat), iar ferestrele de n cuvinte sunt rânduri ale unui tablou NumPy de
+identificatori: nu se creează niciun tuplu sau șir per fereastră. Ferestrele
+unui bloc sunt împachetate într-o cheie de 64 de biți (cât timp identificatorii
+încap) și grupate prin sortare; se păstrează doar n-gramele distincte, cu numărul
+și poziția primei apariții, iar blocurile sunt combinate periodic. Textul
+n-gramelor ("a b") se construiește o singură dată, la final, în ordinea primei
+apariții, ca la un Counter. Numărarea este mereu exactă.
+"""
+import re
+from collections import Counter
+
+from deferred import load_numpy
+from stopwords import compile_stopwords
+from tokenizer import tokenize
+
+# Tipul de analiză este "<n>-grams" (de exemplu "2-grams"), deci n face parte din cheia din cache
+NGRAM_MODE = re.compile(r"(\d+)-grams")
+NGRAM_KIND = "ngrams"
+
+# Valorile lui n oferite în interfață; implicit bigrame
+NGRAM_SIZES = (2, 3, 4, 5)
+DEFAULT_NGRAM = 2
+
+# Identificatorul rezervat care separă segmentele (celulele unui tabel): nicio fereastră nu trece peste el
+BREAK = 0
+
+# Blocurile numărate sunt combinate când au cel puțin atâtea n-grame (sau cât rezultatul de până atunci)
+COMPACT_ROWS = 1 << 20
+
+
+def ngram_mode(n):
+    if n < 2:
+        raise ValueError("n trebuie să fie cel puțin 2")
+    return f"{n}-grams"
+
+
+def ngram_size(mode):
+    """n pentru un tip de analiză "<n>-grams", altfel None"""
+    match = NGRAM_MODE.fullmatch(mode) if isinstance(mode, str) else None
+    return int(match.group(1)) if match else None
+
+
+def analysis_kind(mode):
+    """Tipul de analiză fără n: "ngrams" pentru orice "<n>-grams", altfel mode"""
+    return NGRAM_KIND if ngram_size(mode) else mode
+
+
+class NgramCounter:
+    """Acumulează n-gramele unui text bloc cu bloc, cu aceeași interfață ca ModeCounter.
+
+    Ultimii n - 1 identificatori ai unui bloc sunt păstrați pentru ferestrele
+    care continuă în blocul următor, iar primii n - 1 pentru combinarea cu
+    fragmentul anterior (merge). total_items este numărul de n-grame, iar
+    total_jetoane numărul tuturor cuvintelor, ca pentru "words".
+    """
+
+    def __init__(self, n, connecting_words=()):
+        np = load_numpy()
+        self.n = n
+        self.stopwords = compile_stopwords(frozenset(connecting_words))
+        self.pending = []
+        # Cuvânt -> identificator, în ordinea primei apariții; None este separatorul de segmente
+        self.index = {None: BREAK}
+        self.head = np.empty(0, dtype=np.int64)
+        self.carry = np.empty(0, dtype=np.int64)
+        self.position = 0  # Câți identificatori (inclusiv separatorii) au fost adăugați
+        # N-gramele distincte (rânduri de identificatori), numărul lor și poziția primei apariții
+        self.rows = np.empty((0, n), dtype=np.int64)
+        self.counts = np.empty(0, dtype=np.int64)
+        self.first = np.empty(0, dtype=np.int64)
+        self.blocks = []  # Blocurile numărate, încă necombinate
+        self.buffered = 0
+        self.total_items = 0
+        self.total_tokens = 0
+
+    def intern(self, tokens):
+        """Identificatorii jetoanelor; cuvintele noi sunt numerotate în ordinea primei apariții"""
+        np = load_numpy()
+        index = self.index
+        new = [token for token in dict.fromkeys(tokens) if token not in index]
+        if new:
+            index.update(zip(new, range(len(index), len(index) + len(new))))
+        return np.fromiter(map(index.__getitem__, tokens), dtype=np.int64, count=len(tokens))
+
+    def update(self, text):
+        words = tokenize(text)
+        meaningful, self.pending = self.stopwords.filter(self.pending + words, final=False)
+        self.total_tokens += len(words)
+        self.add(self.intern(meaningful))
+
+    def update_segments(self, texts):
+        """Numără fiecare text ca segment separat (de exemplu celulele unei coloane)"""
+        tokens = self.flush()
+        for text in texts:
+            words = tokenize(text)
+            meaningful, _ = self.stopwords.filter(words)
+            self.total_tokens += len(words)
+            tokens.append(None)
+            tokens.extend(meaningful)
+        tokens.append(None)
+        self.add(self.intern(tokens))
+
+    def flush(self):
+        """Jetoanele păstrate pentru o expresie de legătură care nu mai poate continua"""
+        meaningful = self.stopwords.tail(self.pending)
+        self.pending = []
+        return meaningful
+
+    def add(self, ids):
+        np = load_numpy()
+        if not len(ids):
+            return
+        self.count_windows(np.concatenate((self.carry, ids)), self.position - len(self.carry))
+        self.position += len(ids)
+        if len(self.head) < self.n - 1:
+            self.head = np.concatenate((self.head, ids))[:self.n - 1]
+        self.carry = self.last(np.concatenate((self.carry, ids)))
+
+    def last(self, ids):
+        # Identificatorii cu care pot începe ferestrele neterminate
+        return ids[max(0, len(ids) - (self.n - 1)):]
+
+    def window_counts(self, ids, start):
+        """N-gramele distincte dintr-o secvență de identificatori care începe la poziția start"""
+        np = load_numpy()
+        if len(ids) < self.n:
+            return None
+        windows = np.lib.stride_tricks.sliding_window_view(ids, self.n)
+        positions = np.arange(start, start + len(windows))
+        if (ids == BREAK).any():
+            valid = ~(windows == BREAK).any(axis=1)
+            windows, positions = windows[valid], positions[valid]
+            if not len(windows):
+                return None
+        return self.grouped(windows, np.ones(len(windows), dtype=np.int64), positions)
+
+    def count_windows(self, ids, start):
+        block = self.window_counts(ids, start)
+        if block is None:
+            return
+        self.total_items += int(block[1].sum())
+        self.blocks.append(block)
+        self.buffered += len(block[0])
+        if self.buffered >= max(COMPACT_ROWS, len(self.rows)):
+            self.compact()
+
+    def keys(self, rows):
+        """O cheie comparabilă per rând: identificatorii împachetați pe 64 de biți sau octeții rândului"""
+        np = load_numpy()
+        bits = (len(self.index) - 1).bit_length()
+        if bits * self.n <= 63:
+            keys = np.zeros(len(rows), dtype=np.int64)
+            for column in rows.T:
+                keys <<= bits
+                keys |= column
+            return keys
+        rows = np.ascontiguousarray(rows)
+        return rows.view(np.dtype((np.void, rows.itemsize * self.n))).ravel()
+
+    def grouped(self, rows, counts, first):
+        """Însumează rândurile egale; păstrează prima poziție a fiecăruia"""
+        np = load_numpy()
+        if not len(rows):
+            return rows, counts, first
+        keys = self.keys(rows)
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+        return (rows[order[starts]], np.add.reduceat(counts[order], starts),
+                np.minimum.reduceat(first[order], starts))
+
+    def combined(self, blocks):
+        np = load_numpy()
+        if not blocks:
+            return self.rows, self.counts, self.first
+        parts = [(self.rows, self.counts, self.first), *blocks]
+        return self.grouped(*(np.concatenate(column) for column in zip(*parts)))
+
+    def compact(self):
+        self.rows, self.counts, self.first = self.combined(self.blocks)
+        self.blocks = []
+        self.buffered = 0
+
+    def merge(self, other):
+        # Fragmentele sunt consecutive: ferestrele dintre ele se formează din sfârșitul acestuia și începutul celuilalt
+        np = load_numpy()
+        self.add(self.intern(self.flush()))
+        other.compact()
+        mapping = self.intern(list(other.index))
+        offset = self.position
+        self.count_windows(np.concatenate((self.carry, mapping[other.head])), offset - len(self.carry))
+        if len(other.rows):
+            self.blocks.append((mapping[other.rows], other.counts, other.first + offset))
+            self.buffered += len(other.rows)
+            self.compact()
+
+        self.position += other.position
+        if len(self.head) < self.n - 1:
+            self.head = np.concatenate((self.head, mapping[other.head]))[:self.n - 1]
+        self.carry = self.last(np.concatenate((self.carry, mapping[other.carry])))
+        self.total_items += other.total_items
+        self.total_tokens += other.total_tokens
+        self.pending = list(other.pending)
+
+    def result(self):
+        """(Counter cu n-gramele "a b" în ordinea primei apariții, total_n-grame, total_cuvinte)"""
+        np = load_numpy()
+        tail = self.stopwords.tail(self.pending)
+        blocks = list(self.blocks)
+        total_items = self.total_items
+        if tail:
+            block = self.window_counts(np.concatenate((self.carry, self.intern(tail))),
+                                       self.position - len(self.carry))
+            if block is not None:
+                blocks.append(block)
+                total_items += int(block[1].sum())
+
+        rows, counts, first = self.combined(blocks)
+        order = np.argsort(first, kind="stable")
+        words = np.array(list(self.index), dtype=object)
+        grams = [" ".join(gram) for gram in words[rows[order]].tolist()]
+        return Counter(dict(zip(grams, counts[order].tolist()))), total_items, self.total_tokens
@@ -0,0 +1,98 @@
+import codecs
+import tkinter as tk
+
+# Cât se încarcă în previzualizare la un pas
+PREVIEW_BYTES = 64 * 1024
+PREVIEW_ROWS = 200
+
+# Când partea vizibilă trece de această fracție, se încarcă pagina următoare
+LOAD_MORE_AT = 0.9
+
+
+class LazyPreview:
+    """Previzualizare leneșă pentru zona de conținut.
+
+    Inserează doar prima pagină dintr-un fișier sau dintr-un DataFrame, iar
+    restul se încarcă pe măsură ce utilizatorul derulează. Paginile fișierului
+    sunt citite la cerere cu seek/read, nu prin mmap: un fișier urmărit poate fi
+    trunchiat (rotația jurnalelor), iar accesul la paginile mapate de după noul
+    sfârșit ar opri procesul (SIGBUS).
+    """
+
+    def __init__(self, text_widget):
+        self.text_widget = text_widget
+        self.scrollbar = getattr(text_widget, "vbar", None)
+        self.text_widget.config(yscrollcommand=self.on_yscroll)
+        self.kind = None  # "file" sau "frame"
+        self.source = None
+        self.position = 0
+        self.length = 0
+        self.file = None
+        self.decoder = None
+        self.pending = False
+
+    def reset(self):
+        """Golește zona de text și închide fișierul"""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        self.kind = None
+        self.source = None
+        self.position = 0
+        self.length = 0
+        self.decoder = None
+        self.text_widget.delete(1.0, tk.END)
+
+    def show_file(self, file_path, encoding="utf-8"):
+        self.reset()
+        self.file = open(file_path, "rb")
+        self.length = self.file.seek(0, 2)
+        self.decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        self.kind = "file"
+        self.load_more()
+
+    def show_frame(self, df):
+        self.reset()
+        self.kind = "frame"
+        self.source = df
+        self.length = len(df)
+        self.load_more()
+
+    def show_message(self, message):
+        self.reset()
+        self.text_widget.insert(tk.END, message)
+
+    def has_more(self):
+        return self.kind is not None and self.position < self.length
+
+    def load_more(self):
+        """Adaugă următoarea pagină la sfârșitul zonei de text"""
+        if not self.has_more():
+            return
+
+        if self.kind == "file":
+            size = min(PREVIEW_BYTES, self.length - self.position)
+            self.file.seek(self.position)
+            data = self.file.read(size)
+            end = self.position + len(data)
+            if len(data) < size:
+                self.length = end  # Fișierul a fost trunchiat între timp: previzualizarea se oprește aici
+            page = self.decoder.decode(data, final=end == self.length)
+        else:
+            end = min(self.position + PREVIEW_ROWS, self.length)
+            page = self.source.iloc[self.position:end].to_string(header=self.position == 0)
+            page += "\n"
+
+        self.position = end
+        self.text_widget.insert(tk.END, page)
+
+    def on_yscroll(self, first, last):
+        if self.scrollbar is not None:
+            self.scrollbar.set(first, last)
+        if float(last) >= LOAD_MORE_AT and self.has_more() and not self.pending:
+            self.pending = True
+            self.text_widget.after_idle(self.load_pending)
+
+    def load_pending(self):
+        self.pending = False
+        self.load_more()
@@ -1,9 +1,10 @@
 import tkinter as tk
 from tkinter import filedialog, scrolledtext, ttk
-import string
 import os
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from analysis import (CONNECTING_WORDS, STREAMING_THRESHOLD, CHUNK_SIZE, iter_text_chunks, count_text, count_file,
+                      rank_items)
 
 class TextAnalyzerApp:
     def __init__(self, root):
@@ -13,17 +14,8 @@ class TextAnalyzerApp:
         self.root.iconphoto(True, icon_image)
         self.root.geometry("1000x700")
 
-        # Set of common connecting words to exclude
-        self.connecting_words = {
-            # English
-            "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "with",
-            "by", "of", "from", "as", "if", "then", "than", "when", "where", "why", "how",
-            "is", "are", "was", "were", "be", "been", "being", "this", "that", "these", "those",
-            # Romanian
-            "și", "sau", "dar", "în", "pe", "la", "cu", "de", "din", "ca", "dacă", "apoi",
-            "decât", "când", "unde", "de ce", "cum", "este", "sunt", "a fost", "au fost",
-            "fi", "fost", "fiind", "acest", "acel", "acești", "acei", "cel", "cea", "cei", "cele"
-        }
+        # Set of common connecting words to exclude (stopwords/*.txt)
+        self.connecting_words = set(CONNECTING_WORDS)
 
         # Create the UI components
         self.create_widgets()
@@ -136,6 +128,7 @@ class TextAnalyzerApp:
         self.file_path = ""
         self.sorted_words = []
         self.total_meaningful_words = 0
+        self.streaming = False  # Large files are analyzed straight from disk
 
     def open_file(self):
         # Open file dialog
@@ -145,20 +138,27 @@ class TextAnalyzerApp:
 
         if file_path:
             try:
-                with open(file_path, "r", encoding="utf-8") as file:
-                    self.file_content = file.read()
+                self.streaming = os.path.getsize(file_path) > STREAMING_THRESHOLD
+                if self.streaming:
+                    # Large file: keep it on disk and only show the beginning
+                    self.file_content = ""
+                    preview = next(iter_text_chunks(file_path, CHUNK_SIZE), "")
+                else:
+                    with open(file_path, "r", encoding="utf-8") as file:
+                        self.file_content = file.read()
+                    preview = self.file_content
 
                 self.file_path = file_path
                 self.file_label.config(text=f"File: {os.path.basename(file_path)}")
                 self.content_text.delete(1.0, tk.END)
-                self.content_text.insert(tk.END, self.file_content)
+                self.content_text.insert(tk.END, preview)
                 self.analyze_button.config(state=tk.NORMAL)
                 self.status_bar.config(text=f"File loaded: {os.path.basename(file_path)}")
             except Exception as e:
                 self.status_bar.config(text=f"Error: {str(e)}")
 
     def analyze_text(self):
-        if not self.file_content:
+        if not self.file_content and not self.streaming:
             self.status_bar.config(text="No file content to analyze")
             return
 
@@ -168,30 +168,19 @@ class TextAnalyzerApp:
         # Process the text
         self.status_bar.config(text="Analyzing text...")
 
-        # Remove punctuation and convert to lowercase
-        translator = str.maketrans('', '', string.punctuation)
-        clean_text = self.file_content.translate(translator).lower()
-
-        # Split into words
-        words = clean_text.split()
-
-        # Count words excluding connecting words
-        word_count = {}
-        self.total_meaningful_words = 0
-
-        for word in words:
-            if word not in self.connecting_words and len(word) > 1:  # Exclude single letters too
-                self.total_meaningful_words += 1
-                if word in word_count:
-                    word_count[word] += 1
-                else:
-                    word_count[word] = 1
+        # Count words excluding connecting words and single letters
+        if self.streaming:
+            word_count, self.total_meaningful_words, total_words = count_file(
+                self.file_path, "words", self.connecting_words)
+        else:
+            word_count, self.total_meaningful_words, total_words = count_text(
+                self.file_content, "words", self.connecting_words)
 
         # Sort by frequency (descending)
-        self.sorted_words = sorted(word_count.items(), key=lambda x: x[1], reverse=True)
+        self.sorted_words = rank_items(word_count)
 
         # Display the statistics
-        self.stats_text.insert(tk.END, f"Total Words: {len(words)}\n")
+        self.stats_text.insert(tk.END, f"Total Words: {total_words}\n")
         self.stats_text.insert(tk.END, f"Meaningful Words: {self.total_meaningful_words}\n\n")
         self.stats_text.insert(tk.END, "Word Frequency Statistics:\n")
         self.stats_text.insert(tk.END, "-" * 40 + "\n")
@@ -217,7 +206,8 @@ class TextAnalyzerApp:
             widget.destroy()
 
         # Create a figure for both charts
-        fig = plt.figure(figsize=(10, 8))
+        # Figure outside pyplot, so it is not kept in the pyplot registry once the canvas is gone
+        fig = Figure(figsize=(10, 8))
 
         # Create pie chart - top 6 words
         ax1 = fig.add_subplot(211)
@@ -253,7 +243,7 @@ class TextAnalyzerApp:
         ax2.set_ylabel('Frequency')
 
         # Adjust layout
-        plt.tight_layout()
+        fig.tight_layout()
 
         # Embed the graphs in the Tkinter window
         canvas = FigureCanvasTkAgg(fig, master=self.chart_frame)
@@ -273,6 +263,7 @@ class TextAnalyzerApp:
         self.file_path = ""
         self.sorted_words = []
         self.total_meaningful_words = 0
+        self.streaming = False
         self.analyze_button.config(state=tk.DISABLED)
         self.graph_button.config(state=tk.DISABLED)
 
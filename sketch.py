@@ -0,0 +1,161 @@
+"""Numărare aproximativă cu memorie fixă, pentru intrări foarte mari sau continue.
+
+Count-Min Sketch: depth rânduri a câte width contoare; fiecare element adună
+la câte un contor pe rând, iar estimarea este minimul lor. Supraestimează cu
+cel mult epsilon * N, cu probabilitatea 1 - delta (N = totalul elementelor).
+
+Space-Saving: cel mult capacity = ceil(1 / epsilon) elemente urmărite; un
+element nou îl înlocuiește pe cel mai rar și moștenește numărul lui, care
+devine eroarea sa maximă. Orice element cu frecvența peste N / capacity este
+garantat în listă, iar eroarea fiecărui element este cunoscută exact.
+
+Frecvența raportată este minimul celor două estimări (ambele sunt superioare).
+"""
+import hashlib
+import heapq
+import math
+from collections import Counter
+
+from deferred import load_numpy
+
+DEFAULT_EPSILON = 0.0001
+DEFAULT_DELTA = 0.001
+
+# Sămânța funcțiilor de dispersie: aceeași în toate procesele, deci schițele se pot combina
+HASH_SEED = 20240601
+
+
+class ApproxCounts(Counter):
+    """Counter cu elementele frecvente și eroarea maximă garantată a fiecărei frecvențe.
+
+    max_error este eroarea efectivă a elementelor raportate, iar error_bound
+    garanția a priori (N / capacity), independentă de date.
+    """
+
+    max_error = 0
+    error_bound = 0
+
+
+class HeavyHitters:
+    """Count-Min Sketch + Space-Saving; se folosește în locul unui Counter în ModeCounter"""
+
+    def __init__(self, epsilon=DEFAULT_EPSILON, delta=DEFAULT_DELTA):
+        np = load_numpy()
+        self.epsilon = epsilon
+        self.delta = delta
+        self.bits = max(1, math.ceil(math.log2(math.e / epsilon)))
+        self.width = 1 << self.bits
+        self.depth = max(1, math.ceil(math.log(1 / delta)))
+        self.table = np.zeros((self.depth, self.width), dtype=np.int64)
+        rng = np.random.default_rng(HASH_SEED)
+        self.multipliers = rng.integers(1, 2 ** 63, self.depth, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self.offsets = rng.integers(0, 2 ** 63, self.depth, dtype=np.uint64)
+
+        self.capacity = math.ceil(1 / epsilon)
+        self.counts = {}  # Space-Saving: element -> număr (supraestimat cu cel mult errors[element])
+        self.errors = {}
+        self.heap = []  # (număr, element), actualizat leneș
+        self.total = 0
+
+    def columns(self, tokens):
+        """Coloana fiecărui element pe fiecare rând (dispersie multiply-shift pe 64 de biți)"""
+        np = load_numpy()
+        keys = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little")
+             for token in tokens),
+            dtype=np.uint64, count=len(tokens))
+        with np.errstate(over="ignore"):
+            mixed = self.multipliers[:, None] * keys[None, :] + self.offsets[:, None]
+        return (mixed >> np.uint64(64 - self.bits)).astype(np.intp)
+
+    def update(self, items):
+        """Ca Counter.update: un iterabil de elemente, un dicționar de frecvențe sau altă schiță"""
+        if isinstance(items, HeavyHitters):
+            self.merge(items)
+            return
+        chunk = items if isinstance(items, dict) else Counter(items)
+        if not chunk:
+            return
+        np = load_numpy()
+        tokens = list(chunk)
+        weights = np.fromiter(chunk.values(), dtype=np.int64, count=len(tokens))
+        for row, columns in enumerate(self.columns(tokens)):
+            self.table[row] += np.bincount(columns, weights=weights, minlength=self.width).astype(np.int64)
+        self.total += int(weights.sum())
+        for token, weight in chunk.items():
+            self.add_tracked(token, weight)
+
+    def add_tracked(self, token, weight):
+        if token in self.counts:
+            self.counts[token] += weight
+            return
+        if len(self.counts) < self.capacity:
+            self.counts[token] = weight
+            self.errors[token] = 0
+            heapq.heappush(self.heap, (weight, token))
+            return
+
+        # Înlocuim elementul cel mai rar; intrările vechi din heap sunt corectate la extragere
+        while True:
+            count, rare = heapq.heappop(self.heap)
+            current = self.counts.get(rare)
+            if current == count:
+                break
+            if current is not None:
+                heapq.heappush(self.heap, (current, rare))
+        del self.counts[rare]
+        del self.errors[rare]
+        self.counts[token] = count + weight
+        self.errors[token] = count
+        heapq.heappush(self.heap, (count + weight, token))
+        if len(self.heap) > 4 * self.capacity:
+            self.rebuild_heap()
+
+    def rebuild_heap(self):
+        self.heap = [(count, token) for token, count in self.counts.items()]
+        heapq.heapify(self.heap)
+
+    def merge(self, other):
+        """Combină două schițe cu aceiași parametri (de exemplu din procese diferite)"""
+        self.table += other.table
+        self.total += other.total
+
+        # Un element lipsă dintr-o listă plină poate avea cel mult numărul minim al acelei liste
+        own_floor = min(self.counts.values()) if len(self.counts) >= self.capacity else 0
+        other_floor = min(other.counts.values()) if len(other.counts) >= other.capacity else 0
+        counts = {}
+        errors = {}
+        for token in {**self.counts, **other.counts}:
+            counts[token] = self.counts.get(token, own_floor) + other.counts.get(token, other_floor)
+            errors[token] = self.errors.get(token, own_floor) + other.errors.get(token, other_floor)
+        kept = heapq.nlargest(self.capacity, counts, key=counts.get)
+        self.counts = {token: counts[token] for token in kept}
+        self.errors = {token: errors[token] for token in kept}
+        self.rebuild_heap()
+
+    def estimate(self, tokens):
+        """Estimările Count-Min pentru o listă de elemente"""
+        np = load_numpy()
+        columns = self.columns(tokens)
+        return self.table[np.arange(self.depth)[:, None], columns].min(axis=0)
+
+    def to_counter(self):
+        """Elementele urmărite, cu frecvența min(Space-Saving, Count-Min), în ordinea primei urmăriri"""
+        tokens = list(self.counts)
+        result = ApproxCounts()
+        result.error_bound = self.error_bound()
+        if not tokens:
+            return result
+        estimates = self.estimate(tokens).tolist()
+        max_error = 0
+        for token, sketch_count in zip(tokens, estimates):
+            count = min(self.counts[token], sketch_count)
+            result[token] = count
+            # Space-Saving garantează count - errors <= frecvența reală <= count
+            max_error = max(max_error, count - (self.counts[token] - self.errors[token]))
+        result.max_error = max_error
+        return result
+
+    def error_bound(self):
+        """Eroarea maximă a oricărei frecvențe raportate; niciodată peste N / capacity"""
+        return self.total // self.capacity
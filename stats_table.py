@@ -0,0 +1,214 @@
+import tkinter as tk
+from tkinter import ttk
+from bisect import bisect_left
+
+# Înălțimea implicită a unui rând din Treeview (pixeli)
+ROW_HEIGHT = 20
+
+
+class StatsTable(tk.Frame):
+    """Tabel virtualizat pentru statistici.
+
+    Treeview-ul conține doar rândurile vizibile; bara de derulare lucrează pe
+    indicii din lista de rezultate, deci afișarea nu depinde de mărimea vocabularului.
+    """
+
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+
+        self.items = []  # (element, număr), descrescător după frecvență
+        self.total = 0
+        self.offset = 0  # Indicele primului rând vizibil
+        self.page_size = 25
+        self.sort_key = "count"
+        self.sort_reverse = False
+        self.view = range(0)  # Ordinea curentă a rândurilor, ca indici în self.items
+        self.alpha_order = None  # Construit doar la prima căutare sau sortare alfabetică
+        self.alpha_keys = None
+        self.selected_item = None  # Elementul, nu indicele: rămâne selectat când datele se actualizează
+
+        # Sumar (totaluri)
+        self.summary_label = tk.Label(self, text="", justify=tk.LEFT, anchor=tk.W, font=("Arial", 10))
+        self.summary_label.pack(fill=tk.X, padx=5, pady=(5, 0))
+
+        # Căutare după prefix și salt la rang
+        search_frame = tk.Frame(self)
+        search_frame.pack(fill=tk.X, padx=5, pady=5)
+
+        tk.Label(search_frame, text="Caută:", font=("Arial", 10)).pack(side=tk.LEFT)
+        self.search_var = tk.StringVar()
+        search_entry = tk.Entry(search_frame, textvariable=self.search_var, width=15)
+        search_entry.pack(side=tk.LEFT, padx=5)
+        search_entry.bind("<Return>", lambda event: self.search_prefix())
+
+        tk.Label(search_frame, text="Rang:", font=("Arial", 10)).pack(side=tk.LEFT, padx=(10, 0))
+        self.rank_var = tk.StringVar()
+        rank_entry = tk.Entry(search_frame, textvariable=self.rank_var, width=8)
+        rank_entry.pack(side=tk.LEFT, padx=5)
+        rank_entry.bind("<Return>", lambda event: self.jump_to_rank())
+
+        # Tabelul propriu-zis
+        table_frame = tk.Frame(self)
+        table_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        self.tree = ttk.Treeview(
+            table_frame,
+            columns=("rank", "item", "count", "percent"),
+            show="headings",
+            selectmode="browse"
+        )
+        self.tree.column("rank", width=60, anchor=tk.E)
+        self.tree.column("item", width=160, anchor=tk.W)
+        self.tree.column("count", width=80, anchor=tk.E)
+        self.tree.column("percent", width=90, anchor=tk.E)
+        self.set_headings("Element", "Număr")
+
+        self.scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.tree.bind("<Configure>", self.on_resize)
+        self.tree.bind("<MouseWheel>", self.on_mousewheel)
+        self.tree.bind("<Button-4>", lambda event: self.scroll_to(self.offset - 3))
+        self.tree.bind("<Button-5>", lambda event: self.scroll_to(self.offset + 3))
+        self.tree.bind("<Prior>", lambda event: self.scroll_to(self.offset - self.page_size))
+        self.tree.bind("<Next>", lambda event: self.scroll_to(self.offset + self.page_size))
+
+    def set_headings(self, item_heading, count_heading):
+        self.tree.heading("rank", text="Rang", command=lambda: self.sort_by("count"))
+        self.tree.heading("item", text=item_heading, command=lambda: self.sort_by("item"))
+        self.tree.heading("count", text=count_heading, command=lambda: self.sort_by("count"))
+        self.tree.heading("percent", text="Procentaj", command=lambda: self.sort_by("count"))
+
+    def set_data(self, items, total, summary, item_heading="Element", count_heading="Număr", keep_view=False):
+        """Înlocuiește datele afișate; items trebuie să fie sortate descrescător după frecvență.
+
+        Cu keep_view (actualizările periodice ale aceluiași fișier) se păstrează
+        ordinea, poziția și elementul selectat, în loc să se revină la început.
+        """
+        self.items = items
+        self.total = total
+        self.summary_label.config(text=summary)
+        self.set_headings(item_heading, count_heading)
+        self.alpha_order = None
+        self.alpha_keys = None
+        if not keep_view:
+            self.sort_key = "count"
+            self.sort_reverse = False
+            self.selected_item = None
+            self.offset = 0
+        self.view = self.ordered_view()
+        self.scroll_to(self.offset)
+
+    def clear(self):
+        self.set_data([], 0, "")
+
+    def sort_by(self, key):
+        """Schimbă ordinea de afișare; un clic repetat pe aceeași coloană inversează ordinea"""
+        if not self.items:
+            return
+
+        if key == self.sort_key:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_key = key
+            self.sort_reverse = False
+
+        self.view = self.ordered_view()
+        self.offset = 0
+        self.render()
+
+    def ordered_view(self):
+        """Indicii rândurilor în ordinea de sortare curentă"""
+        if self.sort_key == "count":
+            n = len(self.items)
+            return range(n - 1, -1, -1) if self.sort_reverse else range(n)
+        order = self.alphabetical_order()
+        return order[::-1] if self.sort_reverse else order
+
+    def alphabetical_order(self):
+        """Indicii elementelor în ordine alfabetică (calculat o singură dată)"""
+        if self.alpha_order is None:
+            self.alpha_order = sorted(range(len(self.items)), key=lambda i: str(self.items[i][0]).lower())
+            self.alpha_keys = [str(self.items[i][0]).lower() for i in self.alpha_order]
+        return self.alpha_order
+
+    def view_position(self, index):
+        """Poziția în ordinea curentă a elementului cu indicele dat"""
+        if self.sort_key == "count":
+            return len(self.items) - 1 - index if self.sort_reverse else index
+        # Căutare binară după cheie, apoi avansăm peste elementele cu aceeași cheie
+        key = str(self.items[index][0]).lower()
+        position = bisect_left(self.alpha_keys, key)
+        while self.alpha_order[position] != index:
+            position += 1
+        return len(self.items) - 1 - position if self.sort_reverse else position
+
+    def search_prefix(self):
+        prefix = self.search_var.get().strip().lower()
+        if not prefix or not self.items:
+            return
+
+        order = self.alphabetical_order()
+        position = bisect_left(self.alpha_keys, prefix)
+        if position >= len(order) or not self.alpha_keys[position].startswith(prefix):
+            self.summary_label.bell()
+            return
+
+        self.show_index(order[position])
+
+    def jump_to_rank(self):
+        try:
+            rank = int(self.rank_var.get())
+        except ValueError:
+            self.summary_label.bell()
+            return
+
+        if 1 <= rank <= len(self.items):
+            self.show_index(rank - 1)
+        else:
+            self.summary_label.bell()
+
+    def show_index(self, index):
+        """Derulează astfel încât elementul să fie vizibil și îl selectează"""
+        self.selected_item = self.items[index][0]
+        self.scroll_to(self.view_position(index) - self.page_size // 2)
+
+    def scroll_to(self, offset):
+        self.offset = max(0, min(offset, len(self.items) - self.page_size))
+        self.render()
+
+    def on_scrollbar(self, action, value, unit=None):
+        if action == "moveto":
+            self.scroll_to(int(float(value) * len(self.items)))
+        elif action == "scroll":
+            step = self.page_size if unit == "pages" else 1
+            self.scroll_to(self.offset + int(value) * step)
+
+    def on_mousewheel(self, event):
+        self.scroll_to(self.offset - int(event.delta / 120) * 3)
+        return "break"
+
+    def on_resize(self, event):
+        page_size = max(1, event.height // ROW_HEIGHT - 1)
+        if page_size != self.page_size:
+            self.page_size = page_size
+            self.scroll_to(self.offset)
+
+    def render(self):
+        """Afișează doar pagina vizibilă"""
+        self.tree.delete(*self.tree.get_children())
+
+        end = min(self.offset + self.page_size, len(self.items))
+        for position in range(self.offset, end):
+            index = self.view[position]
+            item, count = self.items[index]
+            percentage = (count / self.total) * 100 if self.total else 0
+            iid = self.tree.insert("", tk.END, values=(index + 1, item, count, f"{percentage:.2f}%"))
+            if item == self.selected_item:
+                self.tree.selection_set(iid)
+
+        if self.items:
+            self.scrollbar.set(self.offset / len(self.items), end / len(self.items))
+        else:
+            self.scrollbar.set(0, 1)
@@ -0,0 +1,116 @@
+"""Cuvinte de legătură (stopwords): câte un fișier per limbă în directorul stopwords/.
+
+Fiecare rând al unui fișier este un cuvânt sau o expresie ("de ce", "a fost");
+rândurile goale și cele care încep cu # sunt ignorate. Intrările sunt
+tokenizate la fel ca textul analizat, iar expresiile sunt compilate într-un
+arbore de jetoane (trie), astfel încât cuvintele și expresiile sunt eliminate
+într-o singură trecere prin lista de cuvinte, fără a căuta fiecare expresie
+separat în text.
+"""
+import os
+from functools import lru_cache
+
+from tokenizer import tokenize
+
+STOPWORDS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stopwords")
+DEFAULT_LANGUAGES = ("en", "ro")
+
+# Marchează în arbore sfârșitul unei expresii (niciun jeton nu este șirul vid)
+END = ""
+
+
+def available_languages(directory=STOPWORDS_DIR):
+    return sorted(os.path.splitext(name)[0] for name in os.listdir(directory) if name.endswith(".txt"))
+
+
+def read_stopwords(file_path):
+    with open(file_path, "r", encoding="utf-8") as file:
+        return [line.strip() for line in file if line.strip() and not line.lstrip().startswith("#")]
+
+
+def load_stopwords(languages=DEFAULT_LANGUAGES, directory=STOPWORDS_DIR):
+    """Reunește listele limbilor date; o limbă poate fi și calea unui fișier propriu"""
+    entries = set()
+    for language in languages:
+        file_path = language if os.path.isfile(language) else os.path.join(directory, f"{language}.txt")
+        if not os.path.isfile(file_path):
+            raise ValueError(f"lista de cuvinte de legătură '{language}' nu există "
+                             f"(disponibile: {', '.join(available_languages(directory))})")
+        entries.update(read_stopwords(file_path))
+    return frozenset(entries)
+
+
+class StopwordMatcher:
+    """Elimină dintr-o listă de jetoane cuvintele de legătură, expresiile și cuvintele de o literă.
+
+    La fiecare poziție care poate începe o expresie se alege cea mai lungă
+    expresie care se potrivește (de exemplu "de ce" înaintea lui "de").
+    """
+
+    def __init__(self, entries):
+        self.single = set()
+        self.trie = {}
+        self.continuing = set()  # Jetoanele după care o expresie mai poate continua
+        for entry in entries:
+            tokens = tokenize(entry)
+            if len(tokens) == 1:
+                self.single.add(tokens[0])
+            elif tokens:
+                node = self.trie
+                for token in tokens:
+                    node = node.setdefault(token, {})
+                node[END] = True
+                self.continuing.update(tokens[:-1])
+
+    def match(self, tokens, start):
+        """(lungimea celei mai lungi expresii de la start, dacă tokens se termină în mijlocul unei expresii)"""
+        node = self.trie
+        length = 0
+        for position in range(start, len(tokens)):
+            node = node.get(tokens[position])
+            if node is None:
+                return length, False
+            if END in node:
+                length = position + 1 - start
+        return length, len(node) > (END in node)
+
+    def filter(self, tokens, final=True):
+        """Întoarce (jetoanele păstrate, restul).
+
+        Cu final=False, jetoanele de la sfârșit care pot începe o expresie
+        neterminată sunt întoarse ca rest, pentru a fi reluate cu blocul următor.
+        """
+        single = self.single
+        candidates = [i for i, token in enumerate(tokens) if token in self.trie] if self.trie else []
+        if not candidates:
+            return [token for token in tokens if token not in single and len(token) > 1], []
+
+        kept = []
+        position = 0
+        cut = len(tokens)
+        for start in candidates:
+            if start < position:
+                continue  # În interiorul unei expresii deja eliminate
+            length, unfinished = self.match(tokens, start)
+            if unfinished and not final:
+                cut = start
+                break
+            if length:
+                kept.extend(token for token in tokens[position:start] if token not in single and len(token) > 1)
+                position = start + length
+        kept.extend(token for token in tokens[position:cut] if token not in single and len(token) > 1)
+        return kept, tokens[cut:]
+
+    def tail(self, pending):
+        """Jetoanele păstrate de filter(final=False), filtrate ca la sfârșitul textului.
+
+        Lista nu este golită: contoarele o folosesc și în result(), fără a o
+        consuma, ca numărarea să poată continua (FileFollower).
+        """
+        return self.filter(pending)[0]
+
+
+@lru_cache(maxsize=16)
+def compile_stopwords(entries):
+    """Matcher-ul unei liste (frozenset) de cuvinte de legătură, compilat o singură dată"""
+    return StopwordMatcher(entries)
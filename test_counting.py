@@ -0,0 +1,99 @@
+"""Verifică faptul că variantele rapide ale numărării dau exact rezultatul căii simple.
+
+Rezultatele sunt comparate complet: contorul (inclusiv ordinea primei apariții,
+care decide ordinea egalităților în clasament) și totalurile.
+"""
+import os
+
+import pytest
+
+import analysis
+from analysis import (ANALYSIS_MODES, CONNECTING_WORDS, MULTI_MODE, count_file_parallel, count_file_stream,
+                      count_mapped_numbers, count_string, shard_file)
+from analysis import RankedItems, rank_items
+from ngrams import ngram_mode
+from token_store import CompactRanked
+
+MODES = (*ANALYSIS_MODES, MULTI_MODE)
+
+
+def compare(result, expected):
+    """Egalitate cu aceeași ordine a elementelor, pentru un mod sau pentru MULTI_MODE"""
+    assert result == expected
+    results = result.values() if isinstance(result, dict) else [result]
+    expected = expected.values() if isinstance(expected, dict) else [expected]
+    for (counts, *_), (expected_counts, *_) in zip(results, expected):
+        assert list(counts) == list(expected_counts)
+
+
+@pytest.fixture
+def sample(tmp_path):
+    """Text cu diacritice, numere și expresii de legătură, scris ca fișier UTF-8"""
+    with open(os.path.join(os.path.dirname(__file__), "text.txt"), encoding="utf-8") as file:
+        text = file.read()
+    extra = "Știință și țară, ŞTIINŢĂ: 3.14 007 12 de ce 2.5.6 în cadrul analizei, straße… 100%\n"
+    text = "".join(f"{text}{extra}{i} " for i in range(40))
+    path = tmp_path / "sample.txt"
+    path.write_text(text, encoding="utf-8")
+    return path, text
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_stream_matches_string(sample, mode):
+    path, text = sample
+    expected = count_string(text, mode, CONNECTING_WORDS)
+    compare(count_file_stream(path, mode, CONNECTING_WORDS, chunk_size=97), expected)
+    compare(count_file_stream(path, mode, CONNECTING_WORDS, chunk_size=4096), expected)
+
+
+@pytest.mark.parametrize("mode", (*MODES, ngram_mode(2), ngram_mode(3)))
+def test_parallel_matches_serial(sample, mode, monkeypatch):
+    path, _ = sample
+    # Fragmente mici, ca fișierul de test să fie împărțit între mai multe procese
+    monkeypatch.setattr(analysis, "CHUNK_SIZE", 4096)
+    assert len(shard_file(path, 4)) == 4
+    expected = count_file_stream(path, mode, CONNECTING_WORDS)
+    compare(count_file_parallel(path, mode, CONNECTING_WORDS, workers=4, chunk_size=4096), expected)
+
+
+def test_mapped_numbers_match_decoded(sample):
+    path, text = sample
+    expected = count_string(text, "numbers")
+    compare(count_mapped_numbers(path, chunk_size=97).result(), expected)
+    compare(count_mapped_numbers(path).result(), expected)
+
+
+@pytest.mark.parametrize("ranked_type", (RankedItems, CompactRanked.from_counter), ids=("counter", "compact"))
+def test_ranked_views_match_full_sort(sample, ranked_type):
+    # Tabelul virtualizat citește doar rândurile vizibile; ele trebuie să fie cele din sortarea completă
+    _, text = sample
+    counts, _, _ = count_string(text, "words")
+    expected = rank_items(counts)
+    for index in (0, 1, 24, 25, len(expected) // 2, -1, -len(expected)):
+        assert ranked_type(counts)[index] == expected[index]
+    for piece in (slice(0, 25), slice(25, 50), slice(10, 0, -1), slice(None, None, -1), slice(-5, -2),
+                  slice(3, 200, 7), slice(5, 5)):
+        assert ranked_type(counts)[piece] == expected[piece]
+    ranked = ranked_type(counts)
+    assert [ranked[i] for i in range(len(ranked))] == expected
+    assert ranked.top(10) == expected[:10]
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+@pytest.mark.parametrize("mode", MODES)
+def test_chunked_csv_matches_whole(tmp_path, mode, workers):
+    pd = pytest.importorskip("pandas")
+    from frame_analysis import count_csv, count_frame
+
+    # O celulă goală doar într-o bucată face coloana de întregi float numai acolo (12 -> 12.0)
+    rows = ["text,values,ratio"]
+    for i in range(60):
+        value = "" if i == 45 else str(i % 13 - 3)
+        rows.append(f"\"Știință și țară {i}, de ce nu\",{value},{i % 7 / 4}")
+    path = tmp_path / "sample.csv"
+    path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+
+    # Bucățile sunt numărate rând cu rând, nu coloană cu coloană: frecvențele și totalurile sunt aceleași,
+    # dar ordinea primei apariții (deci a egalităților) poate diferi între coloane
+    expected = count_frame(pd.read_csv(path), mode, CONNECTING_WORDS)
+    assert count_csv(path, mode, CONNECTING_WORDS, workers=workers, chunk_rows=7) == expected
@@ -0,0 +1,182 @@
+"""Stocare compactă a frecvențelor pentru vocabulare foarte mari.
+
+Un Counter păstrează pentru fiecare element un obiect str, un obiect int și o
+intrare de dicționar, iar clasamentul (listă de tupluri) încă un tuplu per
+element: câteva sute de octeți pe element. Aici fiecare element primește un
+identificator întreg (poziția primei apariții): textele sunt concatenate într-un
+singur bloc UTF-8, iar pozițiile, numerele și ordinea clasamentului sunt
+tablouri NumPy, adică aproximativ 20-30 de octeți pe element.
+"""
+from analysis import grown_prefix
+from deferred import load_numpy
+
+
+class TokenCounts:
+    """Frecvențe indexate după identificator: elementul i este blob[offsets[i]:offsets[i + 1]]"""
+
+    def __init__(self, blob, offsets, counts, max_error=None):
+        self.blob = blob
+        self.offsets = offsets
+        self.counts = counts
+        self.order = None  # Clasamentul complet, calculat la cerere
+        # Doar pentru numărarea aproximativă: cu cât poate fi supraestimată orice frecvență
+        self.max_error = max_error
+        self.error_bound = None  # Garanția a priori a schiței (HeavyHitters.error_bound)
+
+    @classmethod
+    def from_tokens(cls, tokens, counts):
+        np = load_numpy()
+        encoded = [token.encode("utf-8") for token in tokens]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)), out=offsets[1:])
+        return cls(b"".join(encoded), offsets, np.asarray(counts, dtype=np.int64))
+
+    @classmethod
+    def from_counter(cls, counts):
+        """Identificatorii urmează ordinea din Counter, adică ordinea primei apariții"""
+        np = load_numpy()
+        store = cls.from_tokens(list(counts), np.fromiter(counts.values(), dtype=np.int64, count=len(counts)))
+        store.max_error = getattr(counts, "max_error", None)
+        store.error_bound = getattr(counts, "error_bound", None)
+        return store
+
+    def to_bytes(self):
+        """Forma binară (de exemplu pentru cache): numărul de elemente, numerele, pozițiile, apoi textele"""
+        np = load_numpy()
+        numbers = np.concatenate(([len(self)], self.counts, self.offsets)).astype("<i8")
+        return numbers.tobytes() + self.blob
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Inversul lui to_bytes; textele nu sunt decodate"""
+        np = load_numpy()
+        size = int(np.frombuffer(data, dtype="<i8", count=1)[0])
+        numbers = np.frombuffer(data, dtype="<i8", count=2 * size + 2).astype(np.int64)
+        return cls(data[numbers.nbytes:], numbers[size + 1:], numbers[1:size + 1])
+
+    def __len__(self):
+        return len(self.counts)
+
+    def token(self, index):
+        return self.blob[self.offsets[index]:self.offsets[index + 1]].decode("utf-8")
+
+    def tokens(self):
+        blob, offsets = self.blob, self.offsets.tolist()
+        return [blob[start:end].decode("utf-8") for start, end in zip(offsets, offsets[1:])]
+
+    def total(self):
+        return int(self.counts.sum())
+
+    def ranked_order(self):
+        """Identificatorii descrescător după frecvență; la egalitate, în ordinea primei apariții"""
+        if self.order is None:
+            self.order = load_numpy().argsort(-self.counts, kind="stable")
+        return self.order
+
+    def top_ids(self, k):
+        """Primii k identificatori din clasament, fără sortarea completă"""
+        np = load_numpy()
+        k = min(k, len(self))
+        if self.order is not None or k >= len(self) // 4:
+            return self.ranked_order()[:k]
+        if k == 0:
+            return np.empty(0, dtype=np.int64)
+        # Pragul este a k-a frecvență; dintre elementele egale cu pragul le păstrăm pe primele apărute
+        threshold = np.partition(self.counts, len(self) - k)[len(self) - k]
+        above = np.flatnonzero(self.counts > threshold)
+        equal = np.flatnonzero(self.counts == threshold)[:k - len(above)]
+        candidates = np.concatenate((above, equal))
+        return candidates[np.argsort(-self.counts[candidates], kind="stable")]
+
+    def items_at(self, ids):
+        return [(self.token(i), int(count)) for i, count in zip(ids.tolist(), self.counts[ids].tolist())]
+
+    def percentages(self, total=None):
+        """Procentul fiecărui element (vectorizat), în ordinea identificatorilor"""
+        total = self.total() if total is None else total
+        if not total:
+            return load_numpy().zeros(len(self))
+        return self.counts / total * 100
+
+    @classmethod
+    def combine(cls, stores):
+        """Suma frecvențelor mai multor stocări, cu un singur index pentru toate (de exemplu agregatul din batch.py).
+
+        Identificatorii urmează ordinea primei apariții în stocările date, ca la
+        un Counter actualizat pe rând, iar fiecare element este decodat o singură dată.
+        """
+        np = load_numpy()
+        index = {}
+        ids = []
+        for store in stores:
+            ids.append(np.fromiter((index.setdefault(token, len(index)) for token in store.tokens()),
+                                   dtype=np.int64, count=len(store)))
+        counts = np.zeros(len(index), dtype=np.int64)
+        for store_ids, store in zip(ids, stores):
+            counts[store_ids] += store.counts  # Identificatorii unei stocări sunt distincți
+
+        combined = cls.from_tokens(list(index), counts)
+        errors = [store.max_error for store in stores if store.max_error is not None]
+        combined.max_error = sum(errors) if errors else None
+        bounds = [store.error_bound for store in stores if store.error_bound is not None]
+        combined.error_bound = sum(bounds) if bounds else None
+        return combined
+
+
+class CompactRanked:
+    """Clasamentul unui TokenCounts, cu aceeași interfață ca analysis.RankedItems.
+
+    Elementele sunt decodate doar când sunt cerute (de exemplu pagina vizibilă
+    din tabel), deci clasamentul complet nu creează tupluri pentru tot vocabularul.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.prefix = None  # Primii identificatori din clasament, extinși la cerere
+
+    @classmethod
+    def from_counter(cls, counts):
+        return cls(TokenCounts.from_counter(counts))
+
+    def __len__(self):
+        return len(self.store)
+
+    @property
+    def max_error(self):
+        return self.store.max_error
+
+    @property
+    def error_bound(self):
+        return self.store.error_bound
+
+    def ranked_ids(self, k):
+        """Primii k identificatori din clasament; ca la RankedItems, fără sortarea completă cât timp k este mic"""
+        if self.store.order is not None:
+            return self.store.order[:k]
+        if self.prefix is None or k > len(self.prefix):
+            self.prefix = self.store.top_ids(grown_prefix(k, 0 if self.prefix is None else len(self.prefix)))
+        return self.prefix[:k]
+
+    def top(self, k):
+        return self.store.items_at(self.ranked_ids(k))
+
+    def ranked(self):
+        return self.top(len(self.store))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            positions = range(len(self))[index]
+            if not positions:
+                return []
+            prefix = self.ranked_ids(max(positions[0], positions[-1]) + 1)
+            return self.store.items_at(prefix[positions[0]::positions.step][:len(positions)])
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("index în afara clasamentului")
+        i = int(self.ranked_ids(index + 1)[index])
+        return self.store.token(i), int(self.store.counts[i])
+
+    def __iter__(self):
+        return iter(self.ranked())
@@ -0,0 +1,30 @@
+"""Tokenizarea comună tuturor analizelor (ambele interfețe, coloanele Excel/CSV și batch.py).
+
+Textul este normalizat o singură dată: forma NFC (a urmat de breve combinat
+devine ă), literele cu sedilă ş ţ devin cele corecte, cu virgulă (ș ț), iar
+literele sunt aduse la forma de comparare (casefold, de exemplu ß -> ss).
+Un cuvânt este o secvență de litere și cifre Unicode; apostroful și cratima
+sunt păstrate doar în interiorul cuvântului (don't, într-o, e-mail), iar orice
+alt semn (inclusiv „ ” – …) desparte cuvintele.
+"""
+import re
+import unicodedata
+
+WORD_PATTERN = re.compile(r"[^\W_]+(?:['’-][^\W_]+)*")
+
+# ş ţ (cu sedilă) sunt înlocuite cu ș ț (cu virgulă); după casefold apar doar literele mici
+CEDILLA_LETTERS = (("ş", "ș"), ("ţ", "ț"))
+
+
+def normalize(text):
+    text = unicodedata.normalize("NFC", text).casefold()
+    for cedilla, comma in CEDILLA_LETTERS:
+        if cedilla in text:
+            text = text.replace(cedilla, comma)
+    return text
+
+
+def tokenize(text):
+    """Toate cuvintele textului, normalizate, în ordinea apariției"""
+    return WORD_PATTERN.findall(normalize(text))
+